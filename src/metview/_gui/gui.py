@@ -2,9 +2,11 @@
 
 """The main ``show-gui`` widget. It can be embedded or a standalone window."""
 
+import collections
 import functools
 import logging
 import math
+import threading
 import time
 import typing
 
@@ -19,14 +21,20 @@ from .utilities import threader
 from .utility_widgets import collapsible, details_pane
 
 _DEFAULT_LOADING_MESSAGE = "Loading..."
+# NOTE: The most Artwork rows that are ever shown at once
+_CROP_SIZE = 80
 _DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
 _INDEX_TYPES = QtCore.QModelIndex | QtCore.QPersistentModelIndex
 _LOGGER = logging.getLogger(__name__)
+_SEARCH_CACHE_SIZE = 64
+# NOTE: Higher runs first. The search that a user waits on goes before the rows
+# they can see, which go before every other row (populated in the background).
+#
+_BACKGROUND_PRIORITY = 0
+_VISIBLE_ROWS_PRIORITY = 1
+_SEARCH_PRIORITY = 2
 
-SizedT = typing.TypeVar("SizedT", bound=typing.Sized)
 T = typing.TypeVar("T")
-_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
-_LOGGER = logging.getLogger(__name__)
 
 
 class _ArtworkLoadStatistics(typing.NamedTuple):
@@ -110,36 +118,333 @@ class _ArtworkSortFilterProxy(QtCore.QSortFilterProxyModel):
         column = left.column()
 
         if column == art_model.Column.datetime:
-            left_datetime = typing.cast(
-                met_get_type.Datetime | None,
-                left.data(art_model.Model.data_role),
-            )
+            # IMPORTANT: Reading the datetime of unloaded Artwork would query The Met
+            # on the GUI thread, once per-row. Treat them as missing, instead. Once
+            # they're loaded, the proxies are invalidated and they're sorted again.
+            #
+            left_range: met_get_type.DatetimeRange = (None, None)
+            right_range: met_get_type.DatetimeRange = (None, None)
+
+            if _is_details_populated(left):
+                left_range = typing.cast(
+                    met_get_type.DatetimeRange | None,
+                    left.data(art_model.Model.data_role),
+                ) or (None, None)
+
+            if _is_details_populated(right):
+                right_range = typing.cast(
+                    met_get_type.DatetimeRange | None,
+                    right.data(art_model.Model.data_role),
+                ) or (None, None)
+
+            # NOTE: Sort by the start year, then the end year. Missing years go last.
+            for left_datetime, right_datetime in zip(left_range, right_range):
+                if left_datetime == right_datetime:
+                    continue
 
-            if not left_datetime:
-                return False
+                if left_datetime is None:
+                    return False
 
-            right_datetime = typing.cast(
-                met_get_type.Datetime | None,
-                right.data(art_model.Model.data_role),
-            )
+                if right_datetime is None:
+                    return True
 
-            if not right_datetime:
-                return True
+                return left_datetime < right_datetime
 
-            return left_datetime < right_datetime
+            return False
 
         return _get_default_text(left) < _get_default_text(right)
 
 
-class _CropProxy(QtCore.QIdentityProxyModel):
+class _CropProxy(QtCore.QAbstractProxyModel):
     """Prevent a source model from showing more than a certain number of Artworks.
 
     Important:
         XXX: The take-home test mentions cropping any results so we do that here.
         Using this proxy, the table will never exceed 80 results at at time.
 
+    Note:
+        This is a flat, row-for-row proxy like ``QIdentityProxyModel``. But an
+        identity proxy forwards every row that the source inserts, even the rows
+        past the crop. So this class forwards only the inserts / changes that land
+        within the crop.
+
     """
 
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        """Keep track of any source change that is in-progress.
+
+        Args:
+            parent: An object which, if provided, holds a reference to this instance.
+
+        """
+        super().__init__(parent)
+
+        self._is_inserting = False
+        self._is_resetting = False
+        self._layout_indices: list[QtCore.QModelIndex] = []
+        self._layout_sources: list[QtCore.QPersistentModelIndex] = []
+
+    def _get_source(self) -> QtCore.QAbstractItemModel:
+        """Get the model which this instance crops.
+
+        Raises:
+            RuntimeError: If there is no source model.
+
+        Returns:
+            The found source.
+
+        """
+        source = self.sourceModel()
+
+        if not source:
+            raise RuntimeError(f'Proxy "{self}" has no source model.')
+
+        return source
+
+    def _get_source_row_count(self) -> int:
+        """Get the number of rows in the source model, including cropped rows."""
+        if not self.sourceModel():
+            return 0
+
+        return self._get_source().rowCount()
+
+    def _on_source_data_changed(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: list[int],
+    ) -> None:
+        """Forward any source changes that are within the crop.
+
+        Args:
+            top_left: The first changed source row + column.
+            bottom_right: The last changed source row + column.
+            roles: The changed data, if known.
+
+        """
+        if top_left.row() >= _CROP_SIZE:
+            return
+
+        self.dataChanged.emit(
+            self.index(top_left.row(), top_left.column()),
+            self.index(min(bottom_right.row(), _CROP_SIZE - 1), bottom_right.column()),
+            roles,
+        )
+
+    def _on_source_layout_about_to_be_changed(self) -> None:
+        """Remember where every persistent index points before the rows move."""
+        self.layoutAboutToBeChanged.emit()
+
+        self._layout_indices = self.persistentIndexList()
+        self._layout_sources = [
+            QtCore.QPersistentModelIndex(self.mapToSource(index))
+            for index in self._layout_indices
+        ]
+
+    def _on_source_layout_changed(self) -> None:
+        """Point every persistent index at its moved row (if it's still cropped)."""
+        source = self._get_source()
+        new_indices = [
+            (
+                self.mapFromSource(source.index(index.row(), index.column()))
+                if index.isValid()
+                else QtCore.QModelIndex()
+            )
+            for index in self._layout_sources
+        ]
+        self.changePersistentIndexList(self._layout_indices, new_indices)
+        self._layout_indices = []
+        self._layout_sources = []
+
+        self.layoutChanged.emit()
+
+    def _on_source_model_about_to_be_reset(self) -> None:
+        """Start resetting this instance along with its source."""
+        self.beginResetModel()
+
+    def _on_source_model_reset(self) -> None:
+        """Finish resetting this instance along with its source."""
+        self.endResetModel()
+
+    def _on_source_rows_about_to_be_inserted(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        """Forward only the new rows which fit within the crop.
+
+        Args:
+            parent: The source location which gets new rows. Always the root.
+            first: The first source row to insert.
+            last: The last source row to insert.
+
+        """
+        if parent.isValid():
+            return
+
+        count = self._get_source_row_count()
+
+        if first >= _CROP_SIZE:
+            return
+
+        if first != count:
+            # NOTE: Rows inserted in the middle push cropped rows out of view.
+            # That's rare enough that we just start over.
+            #
+            self._is_resetting = True
+            self.beginResetModel()
+
+            return
+
+        self._is_inserting = True
+        self.beginInsertRows(QtCore.QModelIndex(), first, min(last, _CROP_SIZE - 1))
+
+    def _on_source_rows_inserted(self) -> None:
+        """Finish whatever :meth:`_on_source_rows_about_to_be_inserted` started."""
+        if self._is_inserting:
+            self._is_inserting = False
+            self.endInsertRows()
+        elif self._is_resetting:
+            self._is_resetting = False
+            self.endResetModel()
+
+    def _on_source_rows_about_to_be_removed(
+        self, parent: QtCore.QModelIndex, first: int, _: int
+    ) -> None:
+        """Start over if any shown row is about to be removed.
+
+        Args:
+            parent: The source location which loses rows. Always the root.
+            first: The first source row to remove.
+
+        """
+        if parent.isValid() or first >= _CROP_SIZE:
+            return
+
+        self._is_resetting = True
+        self.beginResetModel()
+
+    def _on_source_rows_removed(self) -> None:
+        """Finish whatever :meth:`_on_source_rows_about_to_be_removed` started."""
+        if self._is_resetting:
+            self._is_resetting = False
+            self.endResetModel()
+
+    def canFetchMore(
+        self, parent: _INDEX_TYPES
+    ) -> bool:  # pylint: disable=invalid-name
+        """Stop asking the source model for more rows once the crop is full.
+
+        Args:
+            parent: The source / proxy Qt location to search within for children.
+
+        Returns:
+            If the source model has more rows and there's room to show them.
+
+        """
+        if parent.isValid() or self._get_source_row_count() >= _CROP_SIZE:
+            return False
+
+        return self._get_source().canFetchMore(QtCore.QModelIndex())
+
+    def columnCount(self, parent: _INDEX_TYPES = QtCore.QModelIndex()) -> int:
+        """Get the number of source columns.
+
+        Args:
+            parent: The Qt location to search within for children.
+
+        Returns:
+            All found columns. Artwork has no child rows so this is 0 for any row.
+
+        """
+        if parent.isValid() or not self.sourceModel():
+            return 0
+
+        return self._get_source().columnCount()
+
+    def fetchMore(self, parent: _INDEX_TYPES) -> None:  # pylint: disable=invalid-name
+        """Ask the source model for more rows. Rows past the crop are never shown.
+
+        Args:
+            parent: The Qt location to fetch children for.
+
+        """
+        if not parent.isValid():
+            self._get_source().fetchMore(QtCore.QModelIndex())
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: _INDEX_TYPES = QtCore.QModelIndex(),
+    ) -> QtCore.QModelIndex:
+        """Get the Qt location of ``row`` and ``column``.
+
+        Important:
+            ``column`` isn't checked against :meth:`columnCount` because the source
+            model has hidden columns, e.g. :obj:`.Column.thumbnail`.
+
+        Args:
+            row: A 0-or-more row to get, within the crop.
+            column: A 0-or-more column to get.
+            parent: The Qt location to search within for children.
+
+        Returns:
+            The found index, if any.
+
+        """
+        if parent.isValid() or row < 0 or column < 0 or row >= self.rowCount():
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def mapFromSource(self, source_index: _INDEX_TYPES) -> QtCore.QModelIndex:
+        """Convert ``source_index`` to this instance, if it's within the crop.
+
+        Args:
+            source_index: Some source model location.
+
+        Returns:
+            The cropped location or an invalid index, if it is cropped out.
+
+        """
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.index(source_index.row(), source_index.column())
+
+    def mapToSource(self, proxy_index: _INDEX_TYPES) -> QtCore.QModelIndex:
+        """Convert ``proxy_index`` to the source model.
+
+        Args:
+            proxy_index: Some location within this instance.
+
+        Returns:
+            The source location, if any.
+
+        """
+        if not proxy_index.isValid() or not self.sourceModel():
+            return QtCore.QModelIndex()
+
+        return self._get_source().index(proxy_index.row(), proxy_index.column())
+
+    def parent(  # type: ignore[override]
+        self, child: _INDEX_TYPES | None = None
+    ) -> QtCore.QModelIndex | QtCore.QObject | None:
+        """Get the parent of ``child``. Artwork is flat so there's never a parent.
+
+        Args:
+            child:
+                Some location within this instance. If not provided, this instance's
+                QObject parent is returned instead, like :meth:`QObject.parent`.
+
+        Returns:
+            An invalid index or, if no ``child`` is given, the QObject parent.
+
+        """
+        if child is None:
+            return super().parent()
+
+        return QtCore.QModelIndex()
+
     def rowCount(self, parent: _INDEX_TYPES = QtCore.QModelIndex()) -> int:
         """Force the number of rows to be 80-or-less.
 
@@ -150,7 +455,43 @@ class _CropProxy(QtCore.QIdentityProxyModel):
             All found children, if any.
 
         """
-        return min(80, super().rowCount(parent))
+        if parent.isValid():
+            return 0
+
+        return min(_CROP_SIZE, self._get_source_row_count())
+
+    def setSourceModel(  # pylint: disable=invalid-name
+        self, source_model: QtCore.QAbstractItemModel
+    ) -> None:
+        """Crop ``source_model`` and follow its changes.
+
+        Args:
+            source_model: Some flat (table / list) model to crop.
+
+        """
+        self.beginResetModel()
+        super().setSourceModel(source_model)
+
+        source_model.dataChanged.connect(self._on_source_data_changed)
+        source_model.headerDataChanged.connect(self.headerDataChanged)
+        source_model.layoutAboutToBeChanged.connect(
+            self._on_source_layout_about_to_be_changed
+        )
+        source_model.layoutChanged.connect(self._on_source_layout_changed)
+        source_model.modelAboutToBeReset.connect(
+            self._on_source_model_about_to_be_reset
+        )
+        source_model.modelReset.connect(self._on_source_model_reset)
+        source_model.rowsAboutToBeInserted.connect(
+            self._on_source_rows_about_to_be_inserted
+        )
+        source_model.rowsInserted.connect(self._on_source_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(
+            self._on_source_rows_about_to_be_removed
+        )
+        source_model.rowsRemoved.connect(self._on_source_rows_removed)
+
+        self.endResetModel()
 
 
 class _MaskedDataProxy(QtCore.QIdentityProxyModel):
@@ -190,6 +531,17 @@ class _MaskedDataProxy(QtCore.QIdentityProxyModel):
     data_role = art_model.Model.data_role
     needs_invalidate = QtCore.Signal()
 
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        """Keep track of any in-progress REST API queries.
+
+        Args:
+            parent: An object which, if provided, holds a reference to this instance.
+
+        """
+        super().__init__(parent)
+
+        self._details_workers: set[threader.QueryArtworkDetailsWorker] = set()
+
     def _is_details_populated(self, index: _INDEX_TYPES) -> bool:
         """Check if ``index`` has been partially or fully loaded with data.
 
@@ -261,62 +613,121 @@ class _MaskedDataProxy(QtCore.QIdentityProxyModel):
 
         return super().data(index, role)  # type: ignore
 
+    @QtCore.Slot()
+    def _forget_details_worker(self) -> None:
+        """Release the worker which just finished so that it can be deleted."""
+        self._details_workers.discard(
+            typing.cast(threader.QueryArtworkDetailsWorker, self.sender())
+        )
+
+    def _update_artwork_details(
+        self, details: dict[int, met_get.ObjectDetails | None]
+    ) -> None:
+        """Show the queried ``details`` of some Artwork.
+
+        Args:
+            details: Each Met Museum Artwork ID and its data, if it could be read.
+
+        """
+        source = typing.cast(art_model.Model, iterbot.get_lowest_source(self))
+        source.update_artwork_details(details)
+        self.needs_invalidate.emit()
+
     def populate_rows(
         self, parent: QtCore.QModelIndex, model: QtCore.QAbstractItemModel | None = None
     ) -> None:
         """Request data for all indices under ``parent``.
 
-        We use a series of threads to query The Met's REST API, here. Each thread is
-        response for a batch of Qt indices (to keep the overall thread size down).
+        We use a series of pooled threads to query The Met's REST API, here. Each
+        thread is responsible for a batch of Qt indices (to keep the overall thread
+        count down). Any batches from a previous call that haven't finished are stopped.
 
         Args:
             parent: Some Qt location which has child indices to populate.
 
         """
+        self.stop_populating_rows()
 
-        def _throttle(
-            sequence: typing.Iterable[SizedT],
-        ) -> typing.Generator[SizedT, None, None]:
-            # PERF: We throttle our queries just in case because The Met asks
-            # to keep queries < 80 per second.
-            #
-            throttler = _MetThrottler()
-
-            for group in sequence:
-                throttler.increment(len(group))
-
-                if throttler.needs_to_wait():
-                    throttler.wait()
-
-                yield group
-
-        model = self
-        all_proxy_indices = [
-            model.index(row, qt_constant.ANY_COLUMN, parent) for row in range(100)
-        ]
+        # PERF: We throttle our queries just in case because The Met asks to keep
+        # queries < 80 per second. One throttler is shared across every batch.
+        #
+        throttler = _MetThrottler()
+        artworks = []
+
+        for row in range(self.rowCount(parent)):
+            artwork = typing.cast(
+                model_type.Artwork | None,
+                self.index(row, qt_constant.ANY_COLUMN, parent).data(
+                    art_model.Model.artwork_role
+                ),
+            )
 
-        count = 0
-        for qt_indices in _throttle(_group_nth(all_proxy_indices, 10)):
+            # PERF: Artwork from an earlier search may already be filled out. Only
+            # queue what still needs a request so re-shown searches cost nothing.
+            #
+            if artwork is not None and not artwork.is_details_populated():
+                artworks.append(artwork)
 
-            for index in qt_indices:
-                count += 1
-                start, end = iterbot.get_sibling_range(index)
+        pool = threader.get_network_pool()
 
-                if not start.isValid() or not end.isValid():
-                    _LOGGER.error(
-                        f'Indices "%s / %s" could not be computed.', start, end
-                    )
+        for group in _group_nth(artworks, 10):
+            worker = threader.QueryArtworkDetailsWorker(
+                [artwork.get_identifier() for artwork in group],
+                throttle=throttler.throttle,
+            )
+            # IMPORTANT: We own the worker (not the pool) so that it can't be deleted
+            # while :meth:`stop_populating_rows` still refers to it.
+            #
+            worker.setAutoDelete(False)
+            worker.details_found.connect(self._update_artwork_details)
+            worker.finished.connect(self._forget_details_worker)
+            self._details_workers.add(worker)
+            pool.start(worker, _BACKGROUND_PRIORITY)
+
+    def prioritize_rows(
+        self, rows: typing.Iterable[int], parent: _INDEX_TYPES = QtCore.QModelIndex()
+    ) -> None:
+        """Query the details of ``rows`` before any other rows which are still waiting.
 
-                    continue
+        Args:
+            rows: The rows of this instance that the user can currently see.
+            parent: Some Qt location whose children are ``rows``.
 
-                artwork = typing.cast(
-                    model_type.Artwork, index.data(art_model.Model.artwork_role)
-                )
-                artwork.precompute_details()
+        """
+        identifiers = {
+            typing.cast(
+                model_type.Artwork,
+                self.index(row, qt_constant.ANY_COLUMN, parent).data(
+                    art_model.Model.artwork_role
+                ),
+            ).get_identifier()
+            for row in rows
+        }
+        pool = threader.get_network_pool()
+
+        for worker in self._details_workers:
+            if identifiers.isdisjoint(worker.get_identifiers()):
+                continue
+
+            # NOTE: Only a worker that hasn't started yet can be moved up the queue.
+            # A running worker is already as early as it can be.
+            #
+            if pool.tryTake(worker):
+                pool.start(worker, _VISIBLE_ROWS_PRIORITY)
 
-                model.dataChanged.emit(start, end)
+    def stop_populating_rows(self) -> None:
+        """Stop any batches from :meth:`populate_rows` which are still running."""
+        pool = threader.get_network_pool()
 
-            self.needs_invalidate.emit()
+        for worker in list(self._details_workers):
+            # NOTE: A worker that hasn't started yet can be removed from the pool
+            # outright. Otherwise we ask it to stop and ignore its results. It is
+            # forgotten once it finishes.
+            #
+            if pool.tryTake(worker):
+                self._details_workers.discard(worker)
+            else:
+                worker.request_stop.emit()
 
 
 class _MetThrottler:
@@ -342,6 +753,7 @@ class _MetThrottler:
         self._timeframe = 1
         self._maximum = 80
         self._counter = 0
+        self._lock = threading.Lock()
 
     def _is_timeframe_okay(self) -> bool:
         """Check if the user is > 1 second."""
@@ -364,6 +776,19 @@ class _MetThrottler:
         """
         self._counter += value
 
+    def throttle(self, value: int = 1) -> None:
+        """Record 1+ queries and wait, if needed. This method is thread-safe.
+
+        Args:
+            value: Some 1-or-more value to increase on this instance.
+
+        """
+        with self._lock:
+            self.increment(value)
+
+            if self.needs_to_wait():
+                self.wait()
+
     def wait(self) -> None:
         """Stop execution until enough time has passed (< 1 second)."""
         time.sleep(1 - self._get_elapsed_time())
@@ -529,11 +954,21 @@ class Widget(QtWidgets.QWidget):
 
         main_layout.addWidget(self._artwork_switcher)
 
+        # PERF: Filter functions run once per-row so we keep the user's text here
+        # instead of asking the QLineEdit for it on every row.
+        #
+        self._current_classification = ""
+
         self._source_model: art_model.Model  # NOTE: This will be set soon
         self._masker_proxy = _MaskedDataProxy(parent=self)
         self.set_model(model or art_model.Model())
 
-        self._threads: list[tuple[QtCore.QThread, threader.ArtSearchWorker]] = []
+        self._current_search: threader.ArtSearchWorker | None = None
+        self._search_workers: set[threader.ArtSearchWorker] = set()
+        self._search_generation = 0
+        self._search_cache: collections.OrderedDict[
+            met_get.SearchFilters, typing.Sequence[int]
+        ] = collections.OrderedDict()
         self._throttler = _MetThrottler()
 
         self._filterer_debouncer = QtCore.QTimer(self)
@@ -542,7 +977,7 @@ class Widget(QtWidgets.QWidget):
         self._initialize_interactive_settings()
 
         # NOTE: We show some initial data to the user
-        self._update_search(met_get.get_all_identifiers)
+        self._search(met_get.get_all_identifiers)
         self._artwork_switcher.setCurrentWidget(self._artwork_splitter)
 
     def _initialize_default_settings(self) -> None:
@@ -561,14 +996,30 @@ class Widget(QtWidgets.QWidget):
             "this widget will be automatically hidden "
             "and you will see a table with the data.",
         )
-        self._artwork_view.horizontalHeader().setStretchLastSection(True)
+        horizontal_header = self._artwork_view.horizontalHeader()
+        horizontal_header.setStretchLastSection(True)
+        # NOTE: Arbitrary widths that "look good". Titles tend to be the longest text.
+        horizontal_header.setDefaultSectionSize(180)
+        horizontal_header.resizeSection(art_model.Column.title, 260)
+        horizontal_header.resizeSection(art_model.Column.datetime, 120)
+        # PERF: Every row is one line tall so we tell Qt the row height, up-front.
+        # Otherwise Qt may ask every row for its size, which gets slow for big tables.
+        #
+        vertical_header = self._artwork_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(
+            self._artwork_view.fontMetrics().height() + 6
+        )
+        self._artwork_view.setVerticalScrollMode(
+            QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
         self._artwork_view.setSelectionBehavior(
             QtWidgets.QListView.SelectionBehavior.SelectRows
         )
         self._artwork_view.setSelectionMode(
             QtWidgets.QListView.SelectionMode.ExtendedSelection
         )
-        self._artwork_view.verticalHeader().hide()
+        vertical_header.hide()
 
         self._filter_missing_image_check_box.setToolTip(
             "If enabled, only entries that have a thumbnail will be shown."
@@ -592,20 +1043,33 @@ class Widget(QtWidgets.QWidget):
             self._invalidate_all_proxies()
             self._emit_statistics()
 
-        self._filter_missing_image_check_box.stateChanged.connect(
-            _ignore(self._update_search)
-        )
-
         # PERF: Is a user is typing quickly, to keep the GUI snappy, we wait
-        # for a pause in their typing before refreshing.
+        # for a pause in their typing before refreshing. Every text / check box edit
+        # goes through the same timer so a burst of edits collapses into one search.
+        # Explicit requests (the button, Enter, etc) search immediately instead.
         #
-        self._filterer_debouncer.setInterval(200)  # NOTE: Wait 0.2 sec between refresh
+        self._filterer_debouncer.setInterval(250)  # NOTE: Wait 0.25 sec between refresh
         self._filterer_debouncer.setSingleShot(True)
         self._filterer_debouncer.timeout.connect(self._update_search)
-        self._filter_button.clicked.connect(self._filterer_debouncer.start)
-        self._filter_line.returnPressed.connect(self._filterer_debouncer.start)
+        self._filter_button.clicked.connect(self._update_search)
+        self._filter_line.returnPressed.connect(self._update_search)
+        self._filter_line.textChanged.connect(self._request_search)
+        self._filter_missing_image_check_box.stateChanged.connect(self._request_search)
 
         self._masker_proxy.needs_invalidate.connect(_update_after_invalidate)
+        self._artwork_view.verticalScrollBar().valueChanged.connect(
+            self._prioritize_visible_rows
+        )
+        self._classication_widget.textChanged.connect(
+            self._update_current_classification
+        )
+        self._classication_widget.editingFinished.connect(self._update_search)
+
+    def _forget_search_worker(self) -> None:
+        """Release the search which just finished so that it can be deleted."""
+        self._search_workers.discard(
+            typing.cast(threader.ArtSearchWorker, self.sender())
+        )
 
     def _get_current_artworks(self) -> list[QtCore.QModelIndex]:
         """Get the user's current artwork selection, if any.
@@ -648,9 +1112,30 @@ class Widget(QtWidgets.QWidget):
 
         return [iterbot.map_to_source_recursively(index, source) for index in output]
 
+    def _get_visible_rows(self) -> list[int]:
+        """Find the :class:`_MaskedDataProxy` rows that the user can currently see."""
+        view = self._artwork_view
+        proxy = view.model()
+        top = view.rowAt(0)
+
+        if top == -1:
+            return []
+
+        bottom = view.rowAt(view.viewport().height() - 1)
+
+        if bottom == -1:
+            bottom = proxy.rowCount() - 1
+
+        return [
+            iterbot.map_to_source_recursively(
+                proxy.index(row, qt_constant.ANY_COLUMN), self._masker_proxy
+            ).row()
+            for row in range(top, bottom + 1)
+        ]
+
     def _get_current_classification(self) -> str:
         """Get all user-saved Artwork "classification"."""
-        return self._classication_widget.text()
+        return self._current_classification
 
     def _emit_statistics(self) -> None:
         """Gather information about the Artwork that the user can see."""
@@ -678,74 +1163,94 @@ class Widget(QtWidgets.QWidget):
         # NOTE: If we filtered out all matches, the pane needs to be cleared / hidden.
         self._update_details_pane()
 
+    def _update_current_classification(self, text: str) -> None:
+        """Remember the user's classification ``text`` for later searches / filters.
+
+        Args:
+            text: The raw text from the classification widget.
+
+        """
+        self._current_classification = text.strip()
+
     def _update_details_pane(self) -> None:
         """Show or hide the details pane if the user has selected some artwork."""
         if artworks := self._get_current_artworks():
+            # IMPORTANT: Never query details here, on the GUI thread. Selected rows
+            # that are still loading just jump ahead of the other rows. Once their
+            # details arrive, ``needs_invalidate`` refreshes the pane.
+            #
+            self._masker_proxy.prioritize_rows(index.row() for index in artworks)
             self._details_pane.set_current_artworks(artworks)
             self._details_switcher.setCurrentWidget(self._details_pane)
         else:
             self._details_switcher.setCurrentWidget(self._details_no_selection_label)
 
-    def _update_search(
-        self, caller: typing.Callable[[], list[int]] | None = None
-    ) -> None:
-        """Compose a search to The Met's API and get its results.
+    @QtCore.Slot()
+    def _prioritize_visible_rows(self) -> None:
+        """Load the details of the rows the user is looking at before any others."""
+        # PERF: Details are queried in batches. Batches the user has scrolled to
+        # jump ahead of the off-screen ones (and thumbnails) in the network pool.
+        #
+        if rows := self._get_visible_rows():
+            self._masker_proxy.prioritize_rows(rows)
 
-        Args:
-            caller: A function that can customize how we find Artwork identifiers.
+    @QtCore.Slot()
+    def _request_search(self) -> None:
+        """Search The Met once the user stops editing the filters for a moment.
+
+        Important:
+            Don't connect signals directly to ``QTimer.start``. If a signal passes an
+            integer, e.g. ``QCheckBox.stateChanged``, it becomes the timer's interval.
 
         """
+        self._filterer_debouncer.start()
 
-        def _identifiers_found(identifiers: list[int]) -> None:
-            self._source_model.update_artwork_identifiers(identifiers)
-            self._invalidate_all_proxies()
-            self._masker_proxy.populate_rows(QtCore.QModelIndex(), self._source_model)
-            self._emit_statistics()
+    def _search(
+        self,
+        caller: typing.Callable[[], typing.Sequence[int]],
+        cache_key: met_get.SearchFilters | None = None,
+    ) -> None:
+        """Start a search to The Met's API and show its results once ready.
 
-        def _get_thread_index(thread: QtCore.QThread) -> int | None:
-            for index, (thread_, _) in enumerate(self._threads):
-                if thread == thread_:
-                    return index
+        Args:
+            caller:
+                A function that can customize how we find Artwork identifiers.
+            cache_key:
+                If provided, the found identifiers are cached using this key so
+                that the same search later doesn't need to query The Met again.
 
-            return None
+        """
 
-        def _on_finished(thread: QtCore.QThread) -> None:
-            thread.quit()
+        def _identifiers_found(identifiers: typing.Sequence[int]) -> None:
+            if generation != self._search_generation:
+                # NOTE: A newer search started since this one. Drop the stale results.
+                return
 
-            while True:
-                # NOTE: We shouldn't need to loop more than once but just to be safe,
-                # make sure any possible duplicates are removed.
-                #
-                index = _get_thread_index(thread)
+            if cache_key is not None:
+                self._search_cache[cache_key] = identifiers
 
-                if index is None:
-                    break
+                if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
 
-                self._threads.pop(index)
+            self._show_identifiers(identifiers)
 
-        # NOTE: Cancel any in-progress searches so we can run another
-        for thread, worker in self._threads:
-            worker.request_stop.emit()
+        def _on_finished() -> None:
+            if generation == self._search_generation:
+                self._current_search = None
 
-            if thread.isRunning():
-                thread.quit()
+        self._stop_current_search()
+        generation = self._search_generation
 
-        caller = caller or functools.partial(
-            met_get.search_objects,
-            has_image=self._filter_missing_image_check_box.isChecked(),
-            classification=self._get_current_classification(),
-            text=self._filter_line.text(),
-        )
-        thread = QtCore.QThread(parent=self)
         worker = threader.ArtSearchWorker(caller)
-        self._threads.append((thread, worker))
-        worker.moveToThread(thread)
-        on_finished = functools.partial(_on_finished, thread)
-        worker.errored.connect(on_finished)
-        worker.finished.connect(on_finished)
-
+        # IMPORTANT: We own the worker (not the pool) so that it can't be deleted
+        # while :meth:`_stop_current_search` still refers to it.
+        #
+        worker.setAutoDelete(False)
+        self._current_search = worker
+        self._search_workers.add(worker)
+        worker.finished.connect(_on_finished)
+        worker.finished.connect(self._forget_search_worker)
         worker.identifiers_found.connect(_identifiers_found)
-        thread.started.connect(worker.run)
 
         # PERF: To prevent DDOSing The Met accidentally, we wait.
         # See :class:`_MetThrottler` for details.
@@ -754,7 +1259,63 @@ class Widget(QtWidgets.QWidget):
             self._throttler.wait()
 
         self._throttler.increment()
-        thread.start()
+        # PERF: Re-use pooled threads instead of starting a new thread per-search.
+        # Searches share a pool with thumbnail downloads so both overlap but the
+        # search, which the user is waiting on, is started first.
+        #
+        threader.get_network_pool().start(worker, _SEARCH_PRIORITY)
+
+    def _show_identifiers(self, identifiers: typing.Sequence[int]) -> None:
+        """Replace the Artwork shown to the user with ``identifiers``.
+
+        Args:
+            identifiers: Some Met Museum Artwork IDs (integers) to display.
+
+        """
+        self._source_model.update_artwork_identifiers(identifiers)
+        self._invalidate_all_proxies()
+        self._masker_proxy.populate_rows(QtCore.QModelIndex(), self._source_model)
+        self._prioritize_visible_rows()
+        self._emit_statistics()
+
+    def _stop_current_search(self) -> None:
+        """Cancel any in-progress search and ignore its results, if any."""
+        if self._current_search:
+            self._current_search.request_stop.emit()
+            self._current_search = None
+
+        self._search_generation += 1
+
+    @QtCore.Slot()
+    def _update_search(self) -> None:
+        """Compose a search to The Met's API from the user's filters."""
+        # NOTE: Prevent a pending, debounced search from firing a duplicate request
+        self._filterer_debouncer.stop()
+
+        has_image = self._filter_missing_image_check_box.isChecked()
+        classification = self._get_current_classification()
+        text = self._filter_line.text()
+        key = met_get.get_search_filters(
+            has_image=has_image, classification=classification, text=text
+        )
+
+        # PERF: Users often erase and re-type the same search. Skip The Met entirely.
+        if (identifiers := self._search_cache.get(key)) is not None:
+            self._search_cache.move_to_end(key)
+            self._stop_current_search()
+            self._show_identifiers(identifiers)
+
+            return
+
+        self._search(
+            functools.partial(
+                met_get.search_objects,
+                has_image=has_image,
+                classification=classification,
+                text=text,
+            ),
+            cache_key=key,
+        )
 
     def set_model(self, model: art_model.Model) -> None:
         """Store and display source ``model``.
@@ -771,6 +1332,12 @@ class Widget(QtWidgets.QWidget):
             if not self._filter_missing_image_check_box.isChecked():
                 return False  # Do not filter (show the ``index``)
 
+            if not _is_details_populated(index):
+                # IMPORTANT: Reading the thumbnail URL would query The Met on the GUI
+                # thread. Keep the row until it loads. Then the filter runs again.
+                #
+                return False  # Do not filter (show the ``index``)
+
             source = iterbot.get_lowest_source(index.model())
             source_index = iterbot.map_to_source_recursively(index, source)
             thumbnail_index = source_index.siblingAtColumn(art_model.Column.thumbnail)
@@ -802,7 +1369,7 @@ class Widget(QtWidgets.QWidget):
 
                 return False  # Do not filter (show the ``index``)
 
-            text = self._classication_widget.text().strip()
+            text = self._get_current_classification()
 
             if not text:
                 # NOTE: The user is not filtering by-name
@@ -867,10 +1434,38 @@ def _get_classification_qlineedit() -> line_edit_extended.CompleterLineEdit:
     # the sake of simplicity, let's hard-code it. It's not like classification
     # change that often anyway.
     #
-    completer = QtWidgets.QCompleter(met_get.KNOWN_CLASSIFICATIONS)
+    model = QtCore.QStringListModel(met_get.KNOWN_CLASSIFICATIONS, parent=widget)
+    proxy = QtCore.QSortFilterProxyModel(parent=widget)
+    proxy.setSourceModel(model)
+
+    # NOTE: The proxy does the "contains" matching so the completer must not
+    # filter again by prefix.
+    #
+    completer = QtWidgets.QCompleter(proxy, widget)
     completer.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+    completer.setCompletionMode(
+        QtWidgets.QCompleter.CompletionMode.UnfilteredPopupCompletion
+    )
     widget.setCompleter(completer)
 
+    def _update_filter() -> None:
+        # PERF: Compile the pattern once per-edit so Qt's native regex engine
+        # does the matching instead of us comparing strings in Python.
+        #
+        expression = QtCore.QRegularExpression(
+            QtCore.QRegularExpression.escape(widget.text().strip()),
+            QtCore.QRegularExpression.PatternOption.CaseInsensitiveOption,
+        )
+        expression.optimize()
+        proxy.setFilterRegularExpression(expression)
+
+    # PERF: Wait for a short pause in typing before re-filtering the completions
+    debouncer = QtCore.QTimer(widget)
+    debouncer.setInterval(50)
+    debouncer.setSingleShot(True)
+    debouncer.timeout.connect(_update_filter)
+    widget.textEdited.connect(debouncer.start)
+
     return widget
 
 
@@ -898,19 +1493,18 @@ def _group_nth(items: list[T], max: int) -> list[list[T]]:
     return [items[index : index + max] for index in range(0, len(items), max)]
 
 
-def _ignore(caller: typing.Callable[[], T]) -> typing.Callable[[], T]:
-    """Ignore all arguments to ``caller`` when it gets called later.
+def _is_details_populated(index: _INDEX_TYPES) -> bool:
+    """Check if the Artwork of ``index`` can be read without querying The Met.
 
     Args:
-        caller: A function that we don't want to pass arguments to.
+        index: Some Qt location (proxy or source) to check.
 
     Returns:
-        An augmented ``caller`` that ignores arguments.
+        If the Artwork's details are already loaded, return ``True``.
 
     """
+    artwork = typing.cast(
+        model_type.Artwork | None, index.data(art_model.Model.artwork_role)
+    )
 
-    @functools.wraps(caller)
-    def wrapper(*_: typing.Any, **__: typing.Any) -> T:
-        return caller()
-
-    return wrapper
+    return artwork is not None and artwork.is_details_populated()
@@ -1,13 +1,16 @@
 """The MVC model that interacts between The Met's API and Qt."""
 
+import array
+import collections
 import enum
 import logging
 import typing
 
 from PySide6 import QtCore
 
-from ..._restapi import met_get_type
+from ..._restapi import met_get, met_get_type
 from ..common import qt_constant
+from ..utilities import threader
 from . import model_type
 
 _ARTIST_TOOLTIP = "The person, group, or entity that created the art."
@@ -18,9 +21,21 @@ _DATETIME_TOOLTIP = (
 )
 _TITLE_TOOLTIP = "The name of the artwork, if any"
 
+# NOTE: Broad searches can find tens of thousands of Artwork IDs. Only expose this
+# many rows at a time and let the view ask for more as the user scrolls.
+#
+_FETCH_SIZE = 200
+
+# NOTE: Keep memory bounded during long browsing sessions. Thumbnails are much larger
+# than the Artwork details so we keep fewer of them.
+#
+_CACHE_SIZE = 1024
+_THUMBNAIL_CACHE_SIZE = 512
+
 _INDEX_TYPES = QtCore.QModelIndex | QtCore.QPersistentModelIndex
 _DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
 _TOOLTIP_ROLE = QtCore.Qt.ItemDataRole.ToolTipRole
+_DATA_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +55,56 @@ class Column(enum.IntEnum):
     medium = 1000003
 
 
+# PERF: An O(1) lookup that ``enum`` already builds for us.
+_COLUMN_VALUES = Column._value2member_map_  # pylint: disable=protected-access
+
+# PERF: Plain ints skip an enum attribute lookup on every call to the hot paths below.
+_COL_TITLE = int(Column.title)
+_COL_DATETIME = int(Column.datetime)
+_COL_ARTIST = int(Column.artist)
+_COL_THUMBNAIL = int(Column.thumbnail)
+_COL_CLASSIFICATION = int(Column.classification)
+_COL_MEDIUM = int(Column.medium)
+
+
+# PERF: ``headerData`` is called on every paint / resize / scroll so look the text up
+# directly instead of branching on each column and role.
+#
+_HEADER_DATA: dict[tuple[int, int], str] = {
+    (_COL_TITLE, _DISPLAY_ROLE): "Title",
+    (_COL_TITLE, _TOOLTIP_ROLE): _TITLE_TOOLTIP,
+    (_COL_DATETIME, _DISPLAY_ROLE): "Date",
+    (_COL_DATETIME, _TOOLTIP_ROLE): _DATETIME_TOOLTIP,
+    (_COL_ARTIST, _DISPLAY_ROLE): "Artist",
+    (_COL_ARTIST, _TOOLTIP_ROLE): _ARTIST_TOOLTIP,
+}
+
+# PERF: ``data`` is called for every cell on every paint. Look up how to get the data
+# directly instead of branching on each column and role.
+#
+_DATA_DISPATCH: dict[
+    tuple[int, int], typing.Callable[[model_type.Artwork], typing.Any]
+] = {
+    (_COL_TITLE, _DISPLAY_ROLE): lambda artwork: (
+        artwork.get_title() or "<No title found>"
+    ),
+    (_COL_TITLE, _DATA_ROLE): model_type.Artwork.get_title,
+    (_COL_DATETIME, _DISPLAY_ROLE): model_type.Artwork.get_datetime_display,
+    (_COL_DATETIME, _DATA_ROLE): model_type.Artwork.get_datetime_range,
+    (_COL_ARTIST, _DISPLAY_ROLE): lambda artwork: (
+        artwork.get_artist() or "<No artist found>"
+    ),
+    (_COL_ARTIST, _DATA_ROLE): model_type.Artwork.get_artist,
+    (_COL_THUMBNAIL, _DISPLAY_ROLE): model_type.Artwork.get_thumbnail_url,
+    (_COL_CLASSIFICATION, _DISPLAY_ROLE): lambda artwork: (
+        artwork.get_classification() or "<No classification>"
+    ),
+    (_COL_MEDIUM, _DISPLAY_ROLE): lambda artwork: (
+        artwork.get_medium() or "<No medium>"
+    ),
+}
+
+
 class Model(QtCore.QAbstractTableModel):
     """The MVC model that interacts between The Met's API and Qt.
 
@@ -53,9 +118,8 @@ class Model(QtCore.QAbstractTableModel):
 
     """
 
-    _columns = frozenset(value.value for value in Column.__members__.values())
     artwork_role = QtCore.Qt.ItemDataRole.UserRole
-    data_role = QtCore.Qt.ItemDataRole.UserRole + 1
+    data_role = _DATA_ROLE
 
     def __init__(
         self,
@@ -74,9 +138,23 @@ class Model(QtCore.QAbstractTableModel):
         """
         super().__init__(parent)
 
-        self._identifiers_count = 0
-        self._identifiers = identifiers or []
-        self._cache: dict[int, model_type.Artwork] = {}
+        # PERF: Store IDs unboxed, in one contiguous buffer. It uses much less memory
+        # than a tuple of Python ints when a search finds many Artwork.
+        #
+        self._identifiers: array.array[int] = array.array("q", identifiers or ())
+        self._visible_count = min(_FETCH_SIZE, len(self._identifiers))
+        self._id_to_row = _get_id_to_row(self._identifiers)
+        self._cache: collections.OrderedDict[int, model_type.Artwork] = (
+            collections.OrderedDict()
+        )
+        self._cache_size = _CACHE_SIZE
+        self._thumbnails: collections.OrderedDict[int, bytes | None] = (
+            collections.OrderedDict()
+        )
+        self._thumbnail_cache_size = _THUMBNAIL_CACHE_SIZE
+        self._thumbnail_requests: set[int] = set()
+        self._pending_thumbnail_identifiers: set[int] = set()
+        self._flush_scheduled = False
 
     def _get_artwork(self, index: _INDEX_TYPES) -> model_type.Artwork:
         """Get the real artwork data from `index``.
@@ -88,16 +166,125 @@ class Model(QtCore.QAbstractTableModel):
             The found artwork.
 
         """
-        identifier = self._identifiers[index.row()]
+        return self._get_artwork_by_identifier(self._identifiers[index.row()])
 
-        if identifier in self._cache:
-            node = self._cache[identifier]
-        else:
-            node = model_type.Artwork(identifier=identifier)
-            self._cache[identifier] = node
+    def _get_artwork_by_identifier(self, identifier: int) -> model_type.Artwork:
+        """Get the real artwork data for ``identifier``.
+
+        Args:
+            identifier: Some Met Museum Artwork ID.
+
+        Returns:
+            The found (or newly-created) artwork.
+
+        """
+        node = self._cache.get(identifier)
+
+        if node is not None:
+            self._cache.move_to_end(identifier)
+
+            return node
+
+        node = model_type.Artwork(identifier=identifier)
+        self._cache[identifier] = node
+
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
         return node
 
+    def _get_shown_rows(self, identifiers: typing.Iterable[int]) -> list[int]:
+        """Find the rows of every Artwork in ``identifiers`` which is shown.
+
+        Args:
+            identifiers: Some Met Museum Artwork IDs. Unknown IDs are ignored.
+
+        Returns:
+            Every found row, in ascending order.
+
+        """
+        return sorted(
+            row
+            for identifier in identifiers
+            if (row := self._id_to_row.get(identifier, -1)) != -1
+            and row < self._visible_count
+        )
+
+    def _get_thumbnail_data(self, index: _INDEX_TYPES) -> bytes | None:
+        """Get the thumbnail of ``index`` or start downloading it, if needed.
+
+        Once the download is done, ``dataChanged`` is emitted for ``index``.
+
+        Args:
+            index: Some Qt location to query from.
+
+        Returns:
+            The thumbnail data, if it's been downloaded.
+
+        """
+        identifier = self._identifiers[index.row()]
+
+        if identifier in self._thumbnails:
+            self._thumbnails.move_to_end(identifier)
+
+            return self._thumbnails[identifier]
+
+        # PERF: Downloading a thumbnail is slow and this method is called while Qt
+        # paints. So we download in another thread instead of blocking the GUI.
+        #
+        if identifier not in self._thumbnail_requests:
+            self._thumbnail_requests.add(identifier)
+            worker = threader.ThumbnailWorker(self._get_artwork(index))
+            worker.thumbnail_found.connect(self._set_thumbnail_data)
+            threader.get_network_pool().start(worker)
+
+        return None
+
+    def _set_thumbnail_data(self, identifier: int, thumbnail: bytes | None) -> None:
+        """Store the downloaded ``thumbnail`` and tell any views about it.
+
+        Args:
+            identifier: Some Met Museum Artwork ID whose thumbnail was downloaded.
+            thumbnail: The downloaded data, if any.
+
+        """
+        self._thumbnail_requests.discard(identifier)
+        self._thumbnails[identifier] = thumbnail
+
+        if len(self._thumbnails) > self._thumbnail_cache_size:
+            self._thumbnails.popitem(last=False)
+
+        # PERF: Many thumbnails tend to finish downloading at once. Report them
+        # together on the next event loop iteration so views repaint once, not once
+        # per thumbnail.
+        #
+        self._pending_thumbnail_identifiers.add(identifier)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_thumbnail_updates)
+
+    def _flush_thumbnail_updates(self) -> None:
+        """Emit ``dataChanged`` for each contiguous run of downloaded thumbnail rows."""
+        # NOTE: Rows can move between a download finishing and this flush so we only
+        # look the rows up now. Artwork that is not shown (yet) has nothing to update.
+        #
+        rows = self._get_shown_rows(self._pending_thumbnail_identifiers)
+        self._pending_thumbnail_identifiers.clear()
+        self._flush_scheduled = False
+
+        last_column = self.columnCount() - 1
+
+        # IMPORTANT: ``Column.thumbnail`` is a hidden column. Proxies crash if it is
+        # given to ``dataChanged``, so we report the visible columns of rows instead.
+        #
+        for start, end in _get_runs(rows):
+            self.dataChanged.emit(
+                self.index(start, 0),
+                self.index(end, last_column),
+                [self.data_role],
+            )
+
     def headerData(
         self,
         section: int,
@@ -118,34 +305,47 @@ class Model(QtCore.QAbstractTableModel):
         if orientation == QtCore.Qt.Orientation.Vertical:
             return None
 
-        if section == Column.title:
-            if role == _DISPLAY_ROLE:
-                return "Title"
+        return _HEADER_DATA.get((section, role))
 
-            if role == _TOOLTIP_ROLE:
-                return _TITLE_TOOLTIP
+    def canFetchMore(
+        self, parent: _INDEX_TYPES = QtCore.QModelIndex()
+    ) -> bool:  # pylint: disable=invalid-name
+        """Check if there are found Artwork IDs that are not shown yet.
 
-            return None
+        Args:
+            parent: The immediate Qt location parent to look within.
+
+        Returns:
+            If :meth:`fetchMore` would add any rows.
 
-        if section == Column.datetime:
-            if role == _DISPLAY_ROLE:
-                return "Date"
+        """
+        if parent.isValid():
+            return False
 
-            if role == _TOOLTIP_ROLE:
-                return _DATETIME_TOOLTIP
+        return self._visible_count < len(self._identifiers)
 
-            return None
+    def fetchMore(
+        self, parent: _INDEX_TYPES = QtCore.QModelIndex()
+    ) -> None:  # pylint: disable=invalid-name
+        """Show the next batch of Artwork IDs as rows.
+
+        Args:
+            parent: The immediate Qt location parent to add rows into.
 
-        if section == Column.artist:
-            if role == _DISPLAY_ROLE:
-                return "Artist"
+        """
+        if parent.isValid():
+            return
 
-            if role == _TOOLTIP_ROLE:
-                return _ARTIST_TOOLTIP
+        remainder = min(_FETCH_SIZE, len(self._identifiers) - self._visible_count)
 
-            return None
+        if remainder <= 0:
+            return
 
-        return None
+        self.beginInsertRows(
+            parent, self._visible_count, self._visible_count + remainder - 1
+        )
+        self._visible_count += remainder
+        self.endInsertRows()
 
     def columnCount(
         self, parent: _INDEX_TYPES = QtCore.QModelIndex()
@@ -161,7 +361,7 @@ class Model(QtCore.QAbstractTableModel):
         """
         return 3
 
-    def data(  # pylint: disable=too-many-return-statements
+    def data(
         self,
         index: _INDEX_TYPES,
         role: int = _DISPLAY_ROLE,
@@ -176,171 +376,188 @@ class Model(QtCore.QAbstractTableModel):
             The found data, if any.
 
         """
-        column = index.column()
-
         if role == self.artwork_role:
             return self._get_artwork(index)
 
         if role == _TOOLTIP_ROLE:
             return self._get_artwork(index).get_tooltip()
 
-        if column == Column.title:
-            if role == _DISPLAY_ROLE:
-                return self._get_artwork(index).get_title() or "<No title found>"
+        column = index.column()
 
-            if role == self.data_role:
-                return self._get_artwork(index).get_title()
+        if column == _COL_THUMBNAIL and role == self.data_role:
+            return self._get_thumbnail_data(index)
 
-            if role == _TOOLTIP_ROLE:
-                return _TITLE_TOOLTIP
+        handler = _DATA_DISPATCH.get((column, role))
 
+        if not handler:
             return None
 
-        if column == Column.datetime:
-            if role == _DISPLAY_ROLE:
-                artwork = self._get_artwork(index)
-                start, end = artwork.get_datetime_range()
+        # PERF: Every branch above fetches the Artwork at most once. Unsupported roles
+        # (which Qt asks for often) never fetch it at all.
+        #
+        return handler(self._get_artwork(index))
 
-                if not start:
-                    if end:
-                        return _get_datetime_text(end.year())
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: _INDEX_TYPES = QtCore.QModelIndex(),
+    ) -> QtCore.QModelIndex:
+        """Create a Qt index for ``row`` and ``column`` underneath ``parent``.
 
-                    return "<No Datetime>"
+        Args:
+            row: The horizontal location of some Qt index.
+            column: The vertical location of some Qt index.
+            parent: The starting index, if any.
 
-                if not end:
-                    return _get_datetime_text(start.year())
+        Returns:
+            A valid or invalid index.
 
-                start_year = start.year()
-                end_year = end.year()
+        """
+        # PERF: Qt calls this method for every visible cell so keep it cheap. Only
+        # format log messages if someone is actually listening for them.
+        #
+        if row < 0 or row >= self._visible_count:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    'Row "%s" is out of range of "%s" count.',
+                    row,
+                    self._visible_count,
+                )
 
-                if start_year == end_year:
-                    return _get_datetime_text(start_year)
+            return QtCore.QModelIndex()
 
-                start_text = _get_datetime_text(start_year)
-                end_text = _get_datetime_text(end_year)
+        if column not in _COLUMN_VALUES:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('Column "%s" is not valid.', column)
 
-                return f"{start_text} - {end_text}"
+            return QtCore.QModelIndex()
 
-            if role == _TOOLTIP_ROLE:
-                return _DATETIME_TOOLTIP
+        identifier = self._identifiers[row]
 
-            if role == self.data_role:
-                return self._get_artwork(index).get_datetime_range()
+        return self.createIndex(row, column, identifier)
 
-            return None
+    def rowCount(
+        self, _: _INDEX_TYPES = QtCore.QModelIndex()
+    ) -> int:  # pylint: disable=invalid-name
+        """Get the rows to show in the GUI.
 
-        if column == Column.artist:
-            if role == _DISPLAY_ROLE:
-                return self._get_artwork(index).get_artist() or "<No artist found>"
+        Args:
+            parent: The immediate parent to get the children for.
 
-            if role == self.data_role:
-                return self._get_artwork(index).get_artist()
+        Returns:
+            The number of rows to show.
 
-            if role == _TOOLTIP_ROLE:
-                return _ARTIST_TOOLTIP
+        """
+        return self._visible_count
 
-            return None
+    def set_cache_size(self, size: int) -> None:
+        """Keep at most ``size`` Artwork in memory, forgetting the least recent ones.
 
-        if column == Column.thumbnail:
-            if role == _DISPLAY_ROLE:
-                return self._get_artwork(index).get_thumbnail_url()
+        Args:
+            size: The maximum number of Artwork to keep. Must be at least 1.
 
-            if role == self.data_role:
-                try:
-                    return self._get_artwork(index).get_thumbnail_data()
-                except ConnectionError:
-                    _LOGGER.exception(
-                        'Index "%s" defines a thumbnail but we could not read it.'
-                    )
+        Raises:
+            ValueError: If ``size`` is too small.
 
-                    return None
-                except Exception:
-                    _LOGGER.exception(
-                        'Index "%s" may have thumbnail but we could not read it.'
-                    )
+        """
+        if size < 1:
+            raise ValueError(f'Size "{size}" must be at least 1.')
 
-                    return None
+        self._cache_size = size
 
-            if role == _TOOLTIP_ROLE:
-                return "The raw thumbnail bytes to load into an image. Be careful!"
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
-            return None
+    def set_thumbnail_cache_size(self, size: int) -> None:
+        """Keep at most ``size`` thumbnails in memory, forgetting the least recent ones.
 
-        if column == Column.classification:
-            if role == _DISPLAY_ROLE:
-                return (
-                    self._get_artwork(index).get_classification()
-                    or "<No classification>"
-                )
+        Args:
+            size: The maximum number of thumbnails to keep. Must be at least 1.
 
-            if role == _TOOLTIP_ROLE:
-                return "The type of artwork"
+        Raises:
+            ValueError: If ``size`` is too small.
 
-            return None
+        """
+        if size < 1:
+            raise ValueError(f'Size "{size}" must be at least 1.')
 
-        if column == Column.medium:
-            if role == _DISPLAY_ROLE:
-                return self._get_artwork(index).get_medium() or "<No medium>"
+        self._thumbnail_cache_size = size
 
-            if role == _TOOLTIP_ROLE:
-                return "The material or method used to create the artwork"
+        while len(self._thumbnails) > self._thumbnail_cache_size:
+            self._thumbnails.popitem(last=False)
 
-            return None
+    def _append_artwork_identifiers(self, identifiers: "array.array[int]") -> None:
+        """Replace the current IDs with ``identifiers``, which start with them.
 
-        return None
+        Args:
+            identifiers: The current Artwork IDs plus more at the end.
 
-    def index(
-        self,
-        row: int,
-        column: int,
-        parent: _INDEX_TYPES = QtCore.QModelIndex(),
-    ) -> QtCore.QModelIndex:
-        """Create a Qt index for ``row`` and ``column`` underneath ``parent``.
+        """
+        everything_was_shown = self._visible_count == len(self._identifiers)
+        self._identifiers = identifiers
+        self._id_to_row = _get_id_to_row(self._identifiers)
 
-        Args:
-            row: The horizontal location of some Qt index.
-            column: The vertical location of some Qt index.
-            parent: The starting index, if any.
+        if everything_was_shown:
+            self.fetchMore()
 
-        Returns:
-            A valid or invalid index.
+    def _reorder_artwork_identifiers(self, identifiers: "array.array[int]") -> None:
+        """Replace the current IDs with ``identifiers``, which are the same IDs.
 
-        """
-        if row < 0 or row >= self._identifiers_count:
-            _LOGGER.warning(
-                'Row "%s" is out of range of "%s" count.',
-                row,
-                self._identifiers_count,
-            )
+        Args:
+            identifiers: The current Artwork IDs, in a different order.
 
-            return QtCore.QModelIndex()
+        """
+        self.layoutAboutToBeChanged.emit()
 
-        identifier = self._identifiers[row]
+        old_indices = self.persistentIndexList()
+        moved = [self._identifiers[index.row()] for index in old_indices]
+        self._identifiers = identifiers
+        self._id_to_row = _get_id_to_row(self._identifiers)
+        new_indices = []
 
-        if column not in self._columns:
-            _LOGGER.warning('No column "%s" is not valid.', column)
+        for index, identifier in zip(old_indices, moved):
+            row = self._id_to_row[identifier]
 
-            return QtCore.QModelIndex()
+            if row < self._visible_count:
+                new_indices.append(self.createIndex(row, index.column(), identifier))
+            else:
+                new_indices.append(QtCore.QModelIndex())
 
-        return self.createIndex(row, column, identifier)
+        self.changePersistentIndexList(old_indices, new_indices)
+        self.layoutChanged.emit()
 
-    def rowCount(
-        self, _: _INDEX_TYPES = QtCore.QModelIndex()
-    ) -> int:  # pylint: disable=invalid-name
-        """Get the rows to show in the GUI.
+    def update_artwork_details(
+        self, details: typing.Mapping[int, met_get.ObjectDetails | None]
+    ) -> None:
+        """Fill out Artwork with ``details`` that were queried elsewhere.
 
         Args:
-            parent: The immediate parent to get the children for.
-
-        Returns:
-            The number of rows to show.
+            details:
+                Each Met Museum Artwork ID and its data. If the data is ``None``, the
+                Artwork could not be read and a placeholder is used instead.
 
         """
-        return len(self._identifiers)
+        for identifier, found in details.items():
+            artwork = self._get_artwork_by_identifier(identifier)
+
+            if found:
+                artwork.set_details(found)
+            else:
+                artwork.set_placeholder_details()
+
+        rows = self._get_shown_rows(details)
+        last_column = self.columnCount() - 1
 
-    def update_artwork_identifiers(self, identifiers: list[int]) -> None:
+        for start, end in _get_runs(rows):
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_column))
+
+    def update_artwork_identifiers(self, identifiers: typing.Sequence[int]) -> None:
         """Clear and refresh this model with ``identifiers``.
 
+        If ``identifiers`` only adds to or reorders the current IDs, existing rows
+        are kept so that views hold onto their selection, scroll position, etc.
+
         Important:
             This method reuses the existing Met Museum cache because, we assume, that an
             ID will only ever point to the same Work of Art for the lifetime of the GUI.
@@ -350,25 +567,60 @@ class Model(QtCore.QAbstractTableModel):
             identifiers: Some Met Museum Artwork IDs (integers) to display.
 
         """
+        new = array.array("q", identifiers)
+        count = len(self._identifiers)
+
+        if new == self._identifiers:
+            return
+
+        if count and new[:count] == self._identifiers:
+            self._append_artwork_identifiers(new)
+
+            return
+
+        if len(new) == count and set(new) == set(self._identifiers):
+            self._reorder_artwork_identifiers(new)
+
+            return
+
         self.beginResetModel()
 
-        self._identifiers = identifiers
-        self._identifiers_count = len(self._identifiers)
+        self._identifiers = new
+        self._visible_count = min(_FETCH_SIZE, len(self._identifiers))
+        self._id_to_row = _get_id_to_row(self._identifiers)
 
         self.endResetModel()
 
 
-def _get_datetime_text(year: int) -> str:
-    """Keep track of years (A.D. / B.C).
+def _get_id_to_row(identifiers: typing.Iterable[int]) -> dict[int, int]:
+    """Map each Artwork ID in ``identifiers`` to its row so lookups are O(1).
 
     Args:
-        year: A.D. years are > 0, B.C. are < 0.
+        identifiers: Some Met Museum Artwork IDs (integers), in row order.
 
     Returns:
-        The found text.
+        Each ID and its 0-based row.
 
     """
-    if year < 0:
-        return f"{-1 * year} B.C."
+    return {identifier: row for row, identifier in enumerate(identifiers)}
+
+
+def _get_runs(rows: typing.Iterable[int]) -> list[tuple[int, int]]:
+    """Group sorted ``rows`` into inclusive ranges of consecutive rows.
+
+    Args:
+        rows: Some 0-based rows, in ascending order. e.g. ``[1, 2, 3, 7, 8]``.
+
+    Returns:
+        Each ``(start, end)`` range. e.g. ``[(1, 3), (7, 8)]``.
+
+    """
+    runs: list[tuple[int, int]] = []
+
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
 
-    return str(year)
+    return runs
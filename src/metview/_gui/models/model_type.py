@@ -1,20 +1,66 @@
 """Internal data to define Qt + MVC types."""
 
+import contextlib
 import functools
+import hashlib
 import logging
-import textwrap
+import os
+import tempfile
+import threading
 import typing
 
 import requests
+from PySide6 import QtCore
 
 from ..._restapi import met_get, met_get_type
 
+# NOTE: (connect, read) seconds. Don't let one slow thumbnail hold a thread forever.
+_TIMEOUT = (3.05, 10)
+
+# PERF: Built once so formatting a tooltip doesn't re-scan the text to dedent it.
+_TOOLTIP_TEMPLATE = (
+    "Title: {title}\n"
+    "Artist: {artist}\n"
+    "Date: {date}\n"
+    "Classification: {classification}\n"
+    "Has Thumbnail: {has_thumbnail}\n"
+    "ID: {identifier!r}"
+)
+
+_MAXIMUM_CACHED_THUMBNAILS = 4096
+_TEMPORARY_SUFFIX = ".partial"
+_EVICTION_INTERVAL = 256
+_EVICTION_LOCK = threading.Lock()
+_WRITES_SINCE_EVICTION = 0
+
 _LOGGER = logging.getLogger(__name__)
 
+# PERF: ObjectDetails is immutable so every unreadable Artwork can share this one.
+_PLACEHOLDER_DETAILS = met_get.ObjectDetails(
+    artist="",
+    classification=None,
+    datetime_range=(None, None),
+    medium=None,
+    thumbnail_url=None,
+    title="",
+)
+
 
 class Artwork:
     """The main representation of some Artwork."""
 
+    # PERF: Models keep thousands of these around so we skip the per-instance dict.
+    __slots__ = (
+        "_identifier",
+        "_details",
+        "_datetime_display",
+        "_tooltip",
+        "_resolved",
+    )
+
+    # NOTE: Unset until the details are known. See :meth:`Artwork.__getattr__`.
+    _resolved: met_get.ObjectDetails
+
     def __init__(self, identifier: int) -> None:
         """Keep track of ``identifier`` so we can query with it later.
 
@@ -26,64 +72,64 @@ class Artwork:
 
         self._identifier = identifier
         self._details: met_get.ObjectDetails | None = None
+        self._datetime_display: str | None = None
+        self._tooltip: str | None = None
 
     def _has_thumbnail(self) -> bool:
         """Check if a thumbnail should exist without querying the thumbnail data."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
+        return bool(self._resolved.thumbnail_url)
+
+    def _get_tooltip(self) -> str:
+        """Format a simple breakdown of this instance."""
+        return _TOOLTIP_TEMPLATE.format(
+            title=self.get_title() or "<No title found>",
+            artist=self.get_artist() or "<No artist name found>",
+            date=self.get_datetime_display(),
+            classification=self.get_classification() or "<No classification found>",
+            has_thumbnail=self._has_thumbnail(),
+            identifier=self._identifier,
+        )
 
-        return bool(self._details.thumbnail_url)
+    def get_identifier(self) -> int:
+        """Get the Met Museum ID for this instance."""
+        return self._identifier
 
     def is_details_populated(self) -> bool:
         """Check if this instance has most of its label data yet."""
-        return bool(self._details)
+        return self._details is not None
 
     def get_tooltip(self) -> str:
         """Show a simple breakdown of this instance."""
-        return textwrap.dedent(
-            f"""\
-            Title: {self.get_title() or "<No title found>"}
-            Artist: {self.get_artist() or "<No artist name found>"}
-            Date: {self.get_datetime_range()!s}
-            Classification: {self.get_classification() or "<No classification found>"}
-            Has Thumbnail: {bool(self._has_thumbnail())}
-            ID: {self._identifier!r}"""
-        )
+        # PERF: Views ask for this text often so we only format it once.
+        if self._tooltip is None:
+            self._tooltip = self._get_tooltip()
+
+        return self._tooltip
 
     def get_artist(self) -> str:
         """Get the artwork name / title."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
-
-        return self._details.artist
+        return self._resolved.artist
 
     def get_datetime_range(self) -> met_get_type.DatetimeRange:
         """Get type / method used to create the artwork."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
+        return self._resolved.datetime_range
+
+    def get_datetime_display(self) -> str:
+        """Get the year or year range of the artwork, as display text."""
+        # PERF: Views ask for this text on every paint so we only format it once.
+        if self._datetime_display is None:
+            self._datetime_display = _get_datetime_range_text(self.get_datetime_range())
 
-        return self._details.datetime_range
+        return self._datetime_display
 
     def get_classification(self) -> str | None:
         """Get the type of artwork."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
-
-        return self._details.classification
+        return self._resolved.classification
 
     def get_medium(self) -> str | None:
         """Get the material or method used to create the artwork."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
-
-        return self._details.medium
+        return self._resolved.medium
 
-    @functools.lru_cache()
     def get_thumbnail_data(self) -> bytes | None:
         """Search this instance for a small image so we can load it as a QPixmap later.
 
@@ -92,8 +138,9 @@ class Artwork:
             it is not readable, ``None`` is returned.
 
         """
-        # PERF: The Met's database keeps thumbnail information separate from
-        # the database because the images are large. So we separately cache it.
+        # NOTE: The Met's database keeps thumbnail information separate from the
+        # database because the images are large. Callers (e.g. the Qt model) are
+        # expected to cache the result, with a size limit.
         #
         if thumbnail_url := self.get_thumbnail_url():
             return _read_thumbnail_data(thumbnail_url)
@@ -102,19 +149,11 @@ class Artwork:
 
     def get_thumbnail_url(self) -> str | None:
         """Get the HTTP/S URL to a downloadable thumbnail, if any."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
-
-        return self._details.thumbnail_url
+        return self._resolved.thumbnail_url
 
     def get_title(self) -> str:
         """Get the artwork name / title."""
-        if not self._details:
-            self.precompute_details()
-            self._details = typing.cast(met_get.ObjectDetails, self._details)
-
-        return self._details.title
+        return self._resolved.title
 
     def precompute_details(self) -> None:
         """Get the main data for this instance.
@@ -124,22 +163,32 @@ class Artwork:
 
         """
         try:
-            self._details = met_get.get_identifier_data(self._identifier)
+            details = met_get.get_identifier_data(self._identifier)
         except ConnectionError:
-            _LOGGER.warning(
-                'Artwork "%s" could not be read for details. '
-                "Using a placeholder fallback.",
-                self._identifier,
-            )
+            self.set_placeholder_details()
+        else:
+            self.set_details(details)
 
-            self._details = met_get.ObjectDetails(
-                artist="",
-                classification=None,
-                datetime_range=(None, None),
-                medium=None,
-                thumbnail_url=None,
-                title="",
-            )
+    def set_details(self, details: met_get.ObjectDetails) -> None:
+        """Fill out this instance with ``details`` that were queried elsewhere.
+
+        Args:
+            details: The Met Museum data to display for this instance.
+
+        """
+        self._details = details
+        self._resolved = details
+        self._datetime_display = None
+        self._tooltip = None
+
+    def set_placeholder_details(self) -> None:
+        """Fill out this instance with empty data because its details are unreadable."""
+        _LOGGER.warning(
+            'Artwork "%s" could not be read for details. Using a placeholder fallback.',
+            self._identifier,
+        )
+
+        self.set_details(_PLACEHOLDER_DETAILS)
 
     def __eq__(self, other: typing.Any) -> bool:
         """Check if ``other`` is the same as this instance.
@@ -156,6 +205,32 @@ class Artwork:
 
         return self._identifier == other._identifier
 
+    def __getattr__(self, name: str) -> typing.Any:
+        """Query this instance's details the first time that they're needed.
+
+        Args:
+            name: The attribute which wasn't found the normal way.
+
+        Raises:
+            AttributeError: If ``name`` isn't the lazily-queried details.
+
+        Returns:
+            The queried details.
+
+        """
+        # PERF: Views call the getters on every paint. Once the details are set,
+        # ``_resolved`` is a plain slot so each getter is a single attribute lookup
+        # and this method is never called again.
+        #
+        if name != "_resolved":
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
+
+        self.precompute_details()
+
+        return self._resolved
+
     def __hash__(self) -> int:
         """Serialize this to an immutable type (so we cause it in hash contexts)."""
         return hash((self.__class__.__name__, self._identifier))
@@ -165,20 +240,204 @@ class Artwork:
         return f"{self.__class__.__name__}(identifier={self._identifier!r})"
 
 
+def _get_datetime_range_text(datetime_range: met_get_type.DatetimeRange) -> str:
+    """Describe the years of ``datetime_range``.
+
+    Args:
+        datetime_range: The start and end of some artwork's creation, if known.
+
+    Returns:
+        The found text.
+
+    """
+    start, end = datetime_range
+
+    if not start:
+        if end:
+            return _get_datetime_text(end.year())
+
+        return "<No Datetime>"
+
+    if not end:
+        return _get_datetime_text(start.year())
+
+    start_year = start.year()
+    end_year = end.year()
+
+    if start_year == end_year:
+        return _get_datetime_text(start_year)
+
+    start_text = _get_datetime_text(start_year)
+    end_text = _get_datetime_text(end_year)
+
+    return f"{start_text} - {end_text}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_datetime_text(year: int) -> str:
+    """Keep track of years (A.D. / B.C).
+
+    Args:
+        year: A.D. years are > 0, B.C. are < 0.
+
+    Returns:
+        The found text.
+
+    """
+    if year < 0:
+        return f"{-1 * year} B.C."
+
+    return str(year)
+
+
+def _evict_cached_thumbnails() -> None:
+    """Delete the oldest on-disk thumbnails once there are too many of them."""
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(_get_thumbnail_cache_directory())
+            if not entry.name.endswith(_TEMPORARY_SUFFIX) and entry.is_file()
+        ]
+    except OSError:
+        return
+
+    if len(entries) <= _MAXIMUM_CACHED_THUMBNAILS:
+        return
+
+    # IMPORTANT: Other threads / processes add, replace and evict thumbnails while
+    # we run. So any file may disappear from under us. That's fine, just skip it.
+    #
+    modified: list[tuple[float, str]] = []
+
+    for entry in entries:
+        try:
+            modified.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            continue
+
+    modified.sort()
+
+    for _, path in modified[: len(modified) - _MAXIMUM_CACHED_THUMBNAILS]:
+        try:
+            os.remove(path)
+        except OSError:
+            _LOGGER.debug('Unable to evict "%s" thumbnail.', path)
+
+
+# PERF: Found on first use, not at import time. Importing shouldn't pay for the
+# QStandardPaths lookup and tests can set the environment variable first.
+#
+@functools.lru_cache(maxsize=1)
+def _get_thumbnail_cache_directory() -> str:
+    """Find the directory where downloaded thumbnails are kept between sessions."""
+    directory = os.getenv("METVIEW_THUMBNAIL_CACHE_DIRECTORY")
+
+    if directory:
+        return directory
+
+    root = QtCore.QStandardPaths.writableLocation(
+        QtCore.QStandardPaths.StandardLocation.GenericCacheLocation
+    )
+
+    return os.path.join(root, "metview", "thumbnails")
+
+
+def _get_thumbnail_cache_path(url: str) -> str:
+    """Find the on-disk location where ``url``'s thumbnail is / would be cached."""
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    return os.path.join(_get_thumbnail_cache_directory(), key)
+
+
+def _write_cached_thumbnail(path: str, data: bytes) -> None:
+    """Save thumbnail ``data`` to ``path`` so later sessions can skip downloading it.
+
+    Args:
+        path: The absolute file path on-disk to write to.
+        data: The thumbnail image bytes.
+
+    """
+    global _WRITES_SINCE_EVICTION  # pylint: disable=global-statement
+
+    directory = _get_thumbnail_cache_directory()
+    temporary_path = ""
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        # NOTE: The suffix tells eviction to leave in-progress writes alone
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix=_TEMPORARY_SUFFIX, delete=False
+        ) as handler:
+            temporary_path = handler.name
+            handler.write(data)
+
+        # IMPORTANT: Replacing is atomic so two threads writing the same thumbnail
+        # (or a reader in another process) never see a half-written file.
+        #
+        os.replace(temporary_path, path)
+    except OSError:
+        _LOGGER.debug('Unable to cache "%s" thumbnail.', path)
+
+        if temporary_path:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+
+        return
+
+    with _EVICTION_LOCK:
+        _WRITES_SINCE_EVICTION += 1
+
+        if _WRITES_SINCE_EVICTION < _EVICTION_INTERVAL:
+            return
+
+        _WRITES_SINCE_EVICTION = 0
+
+    _evict_cached_thumbnails()
+
+
 def _read_thumbnail_data(url: str) -> bytes | None:
     """Search ``url`` for thumbnail data so we can load it as a QPixmap later.
 
     Args:
         url: Some https / http URL to request.
 
+    Raises:
+        ConnectionError: If ``url`` is unreadable.
+
     Returns:
         The found thumbnail data, if any.
-        If ``url`` is not readable, ``None`` is returned.
 
     """
-    response = requests.get(url)
+    path = _get_thumbnail_cache_path(url)
+
+    # PERF: Thumbnails never change for a URL so a previous session's download
+    # can be re-used without any HTTP request at all.
+    #
+    try:
+        with open(path, "rb") as handler:
+            return handler.read()
+    except OSError:
+        pass
+
+    # PERF: Thumbnails come from the same few hosts so we re-use connections
+    # instead of paying for a new TCP + TLS handshake per-thumbnail.
+    #
+    try:
+        response = _SESSION.get(url, timeout=_TIMEOUT)
+    except requests.RequestException as error:
+        raise ConnectionError(f'URL "{url}" is unreadable.') from error
 
     if response.status_code != 200:
         raise ConnectionError(f'URL "{url}" is unreadable. Got "{response}" response.')
 
+    # IMPORTANT: The download succeeded. Failing to cache it must never hide that.
+    try:
+        _write_cached_thumbnail(path, response.content)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception('Unable to cache "%s" thumbnail.', path)
+
     return response.content
+
+
+_SESSION = met_get.make_session()
@@ -1,18 +1,35 @@
 """Basic classes to make Qt + multi-threading easier."""
 
+import collections
+import contextlib
+import functools
 import logging
 import typing
 
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui
 
-from ..models import art_model, model_type
+from ..._restapi import met_get
+from ..models import model_type
+
+_IMAGE_SIGNATURES = ((b"\xff\xd8\xff", b"jpeg"), (b"\x89PNG\r\n\x1a\n", b"png"))
+# NOTE: Network requests mostly wait on The Met, not the CPU. So we allow more
+# requests in-flight at once than Qt's CPU-based global thread pool would. Artwork
+# details workers only wait here; their requests share met_get's own executor.
+#
+_MAXIMUM_CONCURRENT_REQUESTS = 16
+_THUMBNAIL_QUALITY = 85  # NOTE: JPEG quality, from 0 (smallest) to 100 (best)
 
 _LOGGER = logging.getLogger(__name__)
 
+MAXIMUM_THUMBNAIL_HEIGHT = 200  # NOTE: In pixels. Taller thumbnails are shrunk.
+
 
-class ArtSearchWorker(QtCore.QObject):
+class ArtSearchWorker(QtCore.QObject, QtCore.QRunnable):
     """Handle any high latency / slow functions here.
 
+    Run this instance with a :class:`PySide6.QtCore.QThreadPool` so that threads are
+    re-used between searches instead of creating a new thread per-search.
+
     Attributes:
         errored:
             If this instance finished but errored, this signal is emitted.
@@ -26,7 +43,8 @@ class ArtSearchWorker(QtCore.QObject):
 
     """
 
-    identifiers_found = QtCore.Signal(list)
+    # PERF: ``object`` passes the (possibly huge) IDs as-is. ``list`` would copy them.
+    identifiers_found = QtCore.Signal(object)
     request_stop = QtCore.Signal()
 
     errored = QtCore.Signal()
@@ -44,16 +62,24 @@ class ArtSearchWorker(QtCore.QObject):
             parent: An object which, if provided, holds a reference to this instance.
 
         """
-        super().__init__(parent)
+        QtCore.QObject.__init__(self, parent)
+        QtCore.QRunnable.__init__(self)
 
-        self._is_running = False
+        # NOTE: Set here, not in ``run``, so that a stop requested while this
+        # instance is still queued (i.e. before ``run``) isn't forgotten.
+        #
+        self._is_running = True
         self._query = query
-        self.request_stop.connect(self.stop)
+        # IMPORTANT: Stop immediately, from the caller's thread. Never wait for an
+        # event loop to deliver the request because ``run`` blocks until it's done.
+        #
+        self.request_stop.connect(self.stop, QtCore.Qt.ConnectionType.DirectConnection)
 
     def run(self) -> None:
         """Look for Met Museum IDs and update the parent thread when it is ready."""
         try:
-            self._is_running = True
+            if not self._is_running:
+                return
 
             identifiers = self._query()
 
@@ -68,3 +94,328 @@ class ArtSearchWorker(QtCore.QObject):
     def stop(self) -> None:
         """Prevent this instane from emitting any "finished" signals."""
         self._is_running = False
+
+
+class QueryArtworkDetailsWorker(QtCore.QObject, QtCore.QRunnable):
+    """Read the details (title, artist, etc) of some Artwork without blocking the GUI.
+
+    Run one instance per batch of Artwork with a :class:`PySide6.QtCore.QThreadPool`
+    so that independent batches are queried in parallel.
+
+    Attributes:
+        details_found:
+            Once the batch is read, each Artwork ID + its details are emitted. If an
+            Artwork could not be read, its details are ``None``.
+        finished:
+            Once this instance is done, whether it found anything or not.
+        request_stop:
+            A signal used externally (from the main thread) to tell this
+            instance not to emit any signals and stop working ASAP.
+
+    """
+
+    details_found = QtCore.Signal(object)
+    finished = QtCore.Signal()
+    request_stop = QtCore.Signal()
+
+    def __init__(
+        self,
+        identifiers: typing.Iterable[int],
+        throttle: typing.Callable[[int], None] | None = None,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        """Keep track of the Artwork to query, later.
+
+        Args:
+            identifiers: Some Met Museum Artwork IDs to read.
+            throttle:
+                A thread-safe function that is given the number of requests we are
+                about to make. It blocks until it's okay to make them.
+            parent: An object which, if provided, holds a reference to this instance.
+
+        """
+        QtCore.QObject.__init__(self, parent)
+        QtCore.QRunnable.__init__(self)
+
+        # NOTE: Set here, not in ``run``, so that a stop requested while this
+        # instance is still queued (i.e. before ``run``) isn't forgotten.
+        #
+        self._is_running = True
+        self._throttle = throttle
+        self._to_run: collections.deque[int] = collections.deque(identifiers)
+        # IMPORTANT: Stop immediately, from the caller's thread. Never wait for an
+        # event loop to deliver the request because ``run`` blocks until it's done.
+        #
+        self.request_stop.connect(self.stop, QtCore.Qt.ConnectionType.DirectConnection)
+
+    def run(self) -> None:
+        """Read every Artwork and update the parent thread when it is ready."""
+        try:
+            if not self._is_running:
+                return
+
+            if self._throttle:
+                self._throttle(len(self._to_run))
+
+            # NOTE: The user may have stopped the worker while we were waiting
+            if not self._is_running or not self._to_run:
+                return
+
+            found = self._query()
+
+            if self._is_running:
+                self.details_found.emit(found)
+        except Exception:
+            _LOGGER.exception('Artwork "%s" could not be queried.', self._to_run)
+        finally:
+            self.finished.emit()
+
+    def _query(self) -> dict[int, met_get.ObjectDetails | None]:
+        """Read every Artwork at once, stopping early if :meth:`stop` is called.
+
+        Returns:
+            Each Artwork ID and its details, if it could be read.
+
+        """
+        found: dict[int, met_get.ObjectDetails | None] = {}
+
+        # NOTE: Take every identifier, first-in-first-out. Requests go out in the
+        # order they were given and, once sent, they're no longer waiting to run.
+        #
+        identifiers = [self._to_run.popleft() for _ in range(len(self._to_run))]
+
+        # PERF: The requests overlap and we collect each one as soon as it finishes.
+        # Closing the generator early cancels any requests that haven't started.
+        #
+        with contextlib.closing(
+            met_get.get_identifier_data_many(identifiers)
+        ) as results:
+            for identifier, details in results:
+                if not self._is_running:
+                    break
+
+                found[identifier] = details
+
+        return found
+
+    def get_identifiers(self) -> list[int]:
+        """Get every Met Museum Artwork ID that this instance has yet to read."""
+        return list(self._to_run)
+
+    def stop(self) -> None:
+        """Prevent this instance from emitting any details."""
+        self._is_running = False
+
+
+class ThumbnailDecodeWorker(QtCore.QObject, QtCore.QRunnable):
+    """Decode + shrink some thumbnail image data without blocking the GUI.
+
+    Run this instance with :meth:`PySide6.QtCore.QThreadPool.globalInstance` because
+    decoding is CPU-bound.
+
+    Attributes:
+        image_decoded:
+            Once decoded, the original thumbnail bytes + the image are emitted. If
+            the bytes could not be decoded, the image is null.
+
+    """
+
+    image_decoded = QtCore.Signal(object, QtGui.QImage)
+
+    def __init__(
+        self,
+        thumbnail: bytes,
+        maximum_height: int,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        """Keep track of the image data to decode, later.
+
+        Args:
+            thumbnail: Some blob of jpg / png / something data to load.
+            maximum_height: The tallest, in pixels, that the decoded image may be.
+            parent: An object which, if provided, holds a reference to this instance.
+
+        """
+        QtCore.QObject.__init__(self, parent)
+        QtCore.QRunnable.__init__(self)
+
+        self._thumbnail = thumbnail
+        self._maximum_height = maximum_height
+
+    def run(self) -> None:
+        """Decode the image and update the parent thread when it is ready."""
+        image, _ = _read_image(self._thumbnail, self._maximum_height)
+        self.image_decoded.emit(self._thumbnail, image)
+
+
+class ThumbnailWorker(QtCore.QObject, QtCore.QRunnable):
+    """Download the thumbnail of some Artwork without blocking the GUI.
+
+    Attributes:
+        thumbnail_found:
+            Once the thumbnail is read, the Artwork's ID + the thumbnail bytes are
+            emitted. If the Artwork has no thumbnail or it could not be read, the
+            bytes are ``None``.
+
+    """
+
+    thumbnail_found = QtCore.Signal(int, object)
+
+    def __init__(
+        self,
+        artwork: model_type.Artwork,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        """Keep track of the Artwork whose thumbnail we'll download, later.
+
+        Args:
+            artwork: Some Met Museum Artwork to download a thumbnail for.
+            parent: An object which, if provided, holds a reference to this instance.
+
+        """
+        QtCore.QObject.__init__(self, parent)
+        QtCore.QRunnable.__init__(self)
+
+        self._artwork = artwork
+
+    def run(self) -> None:
+        """Download the thumbnail and update the parent thread when it is ready."""
+        thumbnail: bytes | None = None
+
+        try:
+            thumbnail = self._artwork.get_thumbnail_data()
+        except ConnectionError:
+            _LOGGER.exception(
+                'Artwork "%s" defines a thumbnail but we could not read it.',
+                self._artwork,
+            )
+        except Exception:
+            _LOGGER.exception(
+                'Artwork "%s" may have thumbnail but we could not read it.',
+                self._artwork,
+            )
+
+        if thumbnail:
+            thumbnail = _shrink_thumbnail(thumbnail, MAXIMUM_THUMBNAIL_HEIGHT)
+
+        self.thumbnail_found.emit(self._artwork.get_identifier(), thumbnail)
+
+
+def _get_image_format(data: bytes) -> bytes:
+    """Find the image format of ``data`` so Qt doesn't have to probe every plugin.
+
+    Args:
+        data: Some blob of jpg / png / something data.
+
+    Returns:
+        The Qt image format name, e.g. ``b"jpeg"``. If the format is not known,
+        return an empty name so that Qt detects it, instead.
+
+    """
+    for signature, format_ in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return format_
+
+    return b""
+
+
+def _read_image(data: bytes, maximum_height: int) -> tuple[QtGui.QImage, bool]:
+    """Decode ``data`` so that it is no taller than ``maximum_height``.
+
+    Args:
+        data: Some blob of jpg / png / something data.
+        maximum_height: The tallest, in pixels, that the decoded image may be.
+
+    Returns:
+        The decoded image and if it had to be scaled down to fit. If ``data`` could
+        not be decoded, the image is null.
+
+    """
+    # NOTE: PySide6 can't wrap ``bytes`` in a QByteArray without copying it. So
+    # this is the one, unavoidable copy. We keep QImageReader anyway (instead
+    # of ``QImage.loadFromData(bytes)``) because a scaled decode is far cheaper
+    # than a full-size decode + a second, scaled copy.
+    #
+    array = QtCore.QByteArray(data)
+    buffer = QtCore.QBuffer(array)
+    reader = QtGui.QImageReader(buffer, _get_image_format(data))
+    size = reader.size()
+
+    if not size.isValid() or size.height() <= maximum_height:
+        return reader.read(), False
+
+    # PERF: Decode straight to the displayed size. For JPEGs this skips most of
+    # the full-resolution decode and we never hold the full-size image.
+    #
+    if reader.supportsOption(QtGui.QImageIOHandler.ImageOption.ScaledSize):
+        width = max(1, round(size.width() * maximum_height / size.height()))
+        reader.setScaledSize(QtCore.QSize(width, maximum_height))
+
+        return reader.read(), True
+
+    image = reader.read()
+
+    # PERF: Other formats (e.g. PNG) must be decoded at full size. A cheap,
+    # nearest-neighbor pass down to 2x the height means the (much slower)
+    # smooth pass only has to filter a fraction of the pixels.
+    #
+    if image.height() > maximum_height * 2:
+        image = image.scaledToHeight(
+            maximum_height * 2, QtCore.Qt.TransformationMode.FastTransformation
+        )
+
+    image = image.scaledToHeight(
+        maximum_height, QtCore.Qt.TransformationMode.SmoothTransformation
+    )
+
+    return image, True
+
+
+def _shrink_thumbnail(thumbnail: bytes, maximum_height: int) -> bytes:
+    """Re-encode ``thumbnail`` so that it is no taller than ``maximum_height``.
+
+    Args:
+        thumbnail: Some blob of jpg / png / something data.
+        maximum_height: The tallest, in pixels, that the image may be.
+
+    Returns:
+        The smaller image data. If ``thumbnail`` is already small enough or could
+        not be decoded, ``thumbnail`` is returned as-is.
+
+    """
+    image, scaled = _read_image(thumbnail, maximum_height)
+
+    if not scaled or image.isNull():
+        # NOTE: Re-encoding an image that wasn't made smaller only loses quality
+        return thumbnail
+
+    # NOTE: JPEG has no transparency so only images that need it stay as PNG
+    format_ = "PNG" if image.hasAlphaChannel() else "JPEG"
+    data = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(data)
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+
+    if not image.save(buffer, format_, _THUMBNAIL_QUALITY):
+        return thumbnail
+
+    if data.size() >= len(thumbnail):
+        return thumbnail
+
+    return data.data()
+
+
+@functools.lru_cache(maxsize=1)
+def get_network_pool() -> QtCore.QThreadPool:
+    """Get the thread pool which all network-bound workers share.
+
+    Searches and thumbnail downloads run here so that many requests overlap
+    without starving :meth:`PySide6.QtCore.QThreadPool.globalInstance`.
+
+    Returns:
+        A thread pool that allows many (mostly idle, waiting) threads at once.
+
+    """
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(_MAXIMUM_CONCURRENT_REQUESTS)
+
+    return pool
@@ -84,6 +84,7 @@ class SectionHider(QtWidgets.QWidget):
         self.setLayout(main_layout)
 
         self._duration = duration
+        self._collapsed_height: int | None = None
 
         self._toggle_button = QtWidgets.QToolButton()
         self._header = QtWidgets.QFrame()
@@ -134,18 +135,21 @@ class SectionHider(QtWidgets.QWidget):
         self._main_content.setMinimumHeight(0)
 
         # let the entire widget grow and shrink with its content
-        self._toggle_animation.addAnimation(
-            QtCore.QPropertyAnimation(self, QtCore.QByteArray(b"minimumHeight"))
-        )
-        self._toggle_animation.addAnimation(
-            QtCore.QPropertyAnimation(self, QtCore.QByteArray(b"maximumHeight"))
-        )
-        self._toggle_animation.addAnimation(
-            QtCore.QPropertyAnimation(
-                self._main_content, QtCore.QByteArray(b"maximumHeight")
-            )
+        self._section_animations = [
+            QtCore.QPropertyAnimation(self, QtCore.QByteArray(b"minimumHeight")),
+            QtCore.QPropertyAnimation(self, QtCore.QByteArray(b"maximumHeight")),
+        ]
+        self._content_animation = QtCore.QPropertyAnimation(
+            self._main_content, QtCore.QByteArray(b"maximumHeight")
         )
 
+        # PERF: The duration never changes so we set it once, here, instead of
+        # every time :meth:`SectionHider.set_content_layout` is called.
+        #
+        for animation in [*self._section_animations, self._content_animation]:
+            animation.setDuration(self._duration)
+            self._toggle_animation.addAnimation(animation)
+
         layout = typing.cast(QtWidgets.QGridLayout | None, self.layout())
 
         if not layout:
@@ -223,6 +227,21 @@ class SectionHider(QtWidgets.QWidget):
 
         self._toggle_animation.start()
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        """Forget the collapsed height whenever the header may change size.
+
+        Args:
+            event: Some font / style / palette / etc change.
+
+        """
+        if event.type() in (
+            QtCore.QEvent.Type.FontChange,
+            QtCore.QEvent.Type.StyleChange,
+        ):
+            self._collapsed_height = None
+
+        super().changeEvent(event)
+
     def set_content_layout(self, layout: QtWidgets.QWidget | QtWidgets.QLayout) -> None:
         """Set ``layout`` to be the main layout of this instance.
 
@@ -247,35 +266,23 @@ class SectionHider(QtWidgets.QWidget):
             widget_to_go_out_of_scope.setLayout(existing_layout)
 
         self._main_content.setLayout(layout)
-        collapsed_height = self.sizeHint().height() - self._main_content.maximumHeight()
-        content_height = layout.sizeHint().height()
-
-        for index in range(self._toggle_animation.animationCount() - 1):
-            section_animation = self._toggle_animation.animationAt(index)
-
-            if not isinstance(section_animation, QtCore.QPropertyAnimation):
-                raise RuntimeError(
-                    f'Animation "{section_animation}" is invalid. '
-                    "We expected a QPropertyAnimation.",
-                )
-
-            section_animation.setDuration(self._duration)
-            section_animation.setStartValue(collapsed_height)
-            section_animation.setEndValue(collapsed_height + content_height)
+        # PERF: ``sizeHint`` re-negotiates the size of every child widget. The
+        # collapsed (header) height only changes with the font / style so we keep it.
+        #
+        if self._collapsed_height is None:
+            self._collapsed_height = (
+                self.sizeHint().height() - self._main_content.maximumHeight()
+            )
 
-        content_animation = self._toggle_animation.animationAt(
-            self._toggle_animation.animationCount() - 1
-        )
+        collapsed_height = self._collapsed_height
+        content_height = layout.sizeHint().height()
 
-        if not isinstance(content_animation, QtCore.QPropertyAnimation):
-            raise RuntimeError(
-                f'Animation "{content_animation}" is invalid. '
-                "We expected a QPropertyAnimation.",
-            )
+        for animation in self._section_animations:
+            animation.setStartValue(collapsed_height)
+            animation.setEndValue(collapsed_height + content_height)
 
-        content_animation.setDuration(self._duration)
-        content_animation.setStartValue(0)
-        content_animation.setEndValue(content_height)
+        self._content_animation.setStartValue(0)
+        self._content_animation.setEndValue(content_height)
 
     def set_frame_shape(self, shape: QtWidgets.QFrame.Shape) -> None:
         """Change this expandable section's appearance to ``shape``.
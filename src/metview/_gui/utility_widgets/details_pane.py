@@ -1,5 +1,6 @@
 """The right-hand side view of :ref:`metview`. It shows basic artwork + artist data."""
 
+import hashlib
 import logging
 import typing
 
@@ -7,9 +8,16 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from ..common import common_qt, iterbot
 from ..models import art_model, model_type
+from ..utilities import threader
 
 _LOGGER = logging.getLogger(__name__)
 _DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_LOADING_MESSAGE = "Loading..."
+
+# PERF: Re-opening a tab / re-selecting artwork shows the decoded thumbnail again
+# instead of decoding it from scratch. Thumbnails are ~100 KiB once decoded.
+#
+QtGui.QPixmapCache.setCacheLimit(64 * 1024)  # NOTE: In KiB
 
 
 class _DetailsPage(QtWidgets.QWidget):
@@ -44,7 +52,7 @@ class _DetailsPage(QtWidgets.QWidget):
         self._medium_line = QtWidgets.QLineEdit()
         self._no_thumbnail_label = QtWidgets.QLabel("No thumbnail")
         self._thumbnail_label = QtWidgets.QLabel()
-        self._thumbnail_label.setMaximumHeight(200)
+        self._thumbnail_label.setMaximumHeight(threader.MAXIMUM_THUMBNAIL_HEIGHT)
         self._thumbnail_switcher = QtWidgets.QStackedWidget()
         self._thumbnail_switcher.addWidget(self._no_thumbnail_label)
         self._thumbnail_switcher.addWidget(self._thumbnail_label)
@@ -67,6 +75,10 @@ class _DetailsPage(QtWidgets.QWidget):
         expanding = QtWidgets.QSizePolicy.Policy.Expanding
         main_layout.addItem(QtWidgets.QSpacerItem(1, 1, expanding, expanding))
 
+        self._thumbnail_index = QtCore.QPersistentModelIndex()
+        self._pending_thumbnail: bytes | None = None
+        self._shown_thumbnail: bytes | None = None
+
         self._initialize_default_settings()
         self.set_current_artwork(index)
 
@@ -98,26 +110,121 @@ class _DetailsPage(QtWidgets.QWidget):
         self._no_thumbnail_label.setToolTip("No artwork image preview could be found.")
         self._thumbnail_label.setToolTip("Here is what the artwork looks like.")
 
-    def _make_thumbnail_pixmap(self, thumbnail: bytes) -> QtGui.QPixmap:
-        """Load ``thumbnail`` image as a Qt object.
+    def _get_pixmap_cache_key(self, thumbnail: bytes) -> str:
+        """Get a unique name for ``thumbnail`` decoded at this instance's size.
 
         Args:
-            thumbnail: Some blob of jpg / png / something data to load.
+            thumbnail: Some blob of jpg / png / something data.
 
         Returns:
-            The loaded image.
+            The key to use with :class:`PySide6.QtGui.QPixmapCache`.
 
         """
-        pixmap = QtGui.QPixmap()
-        pixmap.loadFromData(QtCore.QByteArray(thumbnail))
-        maximum_height = self._thumbnail_label.maximumHeight()
+        digest = hashlib.blake2b(thumbnail, digest_size=16).hexdigest()
+
+        return f"metview:{self._thumbnail_label.maximumHeight()}:{digest}"
+
+    def _set_thumbnail_image(self, thumbnail: bytes, image: QtGui.QImage) -> None:
+        """Show the decoded ``image`` if it's still the current artwork's thumbnail.
 
-        if pixmap.height() > maximum_height:
-            pixmap = pixmap.scaledToHeight(
-                maximum_height, QtCore.Qt.TransformationMode.SmoothTransformation
+        Args:
+            thumbnail: The bytes that ``image`` was decoded from.
+            image: The decoded, display-sized thumbnail.
+
+        """
+        if thumbnail is not self._pending_thumbnail:
+            # NOTE: The thumbnail changed while this one decoded. Drop the stale image.
+            return
+
+        self._pending_thumbnail = None
+
+        if image.isNull():
+            _LOGGER.warning(
+                'Thumbnail of "%s" could not be decoded.', self._thumbnail_index
             )
 
-        return pixmap
+            return
+
+        # IMPORTANT: QPixmap may only be made on the GUI thread. That's why the
+        # worker gives us a QImage.
+        #
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(self._get_pixmap_cache_key(thumbnail), pixmap)
+        self._show_thumbnail_pixmap(thumbnail, pixmap)
+
+    def _show_thumbnail_pixmap(self, thumbnail: bytes, pixmap: QtGui.QPixmap) -> None:
+        """Display ``pixmap`` as the current artwork's thumbnail.
+
+        Args:
+            thumbnail: The bytes that ``pixmap`` was decoded from.
+            pixmap: The decoded, display-sized thumbnail.
+
+        """
+        self._shown_thumbnail = thumbnail
+        self._thumbnail_label.setPixmap(pixmap)
+        self._thumbnail_switcher.setCurrentWidget(self._thumbnail_label)
+
+    def _update_thumbnail(self) -> None:
+        """Show the current artwork's thumbnail, if it has one."""
+        thumbnail = typing.cast(
+            bytes | None,
+            self._thumbnail_index.data(art_model.Model.data_role),
+        )
+
+        if thumbnail and thumbnail in (self._pending_thumbnail, self._shown_thumbnail):
+            # NOTE: Other data of the row changed. This thumbnail is already handled.
+            return
+
+        if thumbnail and (
+            pixmap := QtGui.QPixmapCache.find(self._get_pixmap_cache_key(thumbnail))
+        ):
+            self._pending_thumbnail = None
+            self._show_thumbnail_pixmap(thumbnail, pixmap)
+
+            return
+
+        # NOTE: Until the new thumbnail is decoded (if any), we show nothing
+        self._thumbnail_switcher.setCurrentWidget(self._no_thumbnail_label)
+        self._pending_thumbnail = thumbnail
+        self._shown_thumbnail = None
+
+        if not thumbnail:
+            return
+
+        # PERF: Decoding + scaling is slow. Opening many tabs at once would block
+        # the GUI so we decode in another thread and only show the result here.
+        #
+        worker = threader.ThumbnailDecodeWorker(
+            thumbnail, self._thumbnail_label.maximumHeight()
+        )
+        worker.image_decoded.connect(self._set_thumbnail_image)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _update_thumbnail_if_needed(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: typing.Sequence[int] = (),
+    ) -> None:
+        """Refresh the thumbnail if its row is within ``top_left`` and ``bottom_right``.
+
+        Args:
+            top_left: The first changed row / column.
+            bottom_right: The last changed row / column.
+            roles: The changed data, if any. If empty, all data may have changed.
+
+        """
+        if roles and art_model.Model.data_role not in roles:
+            return
+
+        if (
+            not self._thumbnail_index.isValid()
+            or top_left.model() != self._thumbnail_index.model()
+        ):
+            return
+
+        if top_left.row() <= self._thumbnail_index.row() <= bottom_right.row():
+            self._update_thumbnail()
 
     def clear_current_artwork(self) -> None:
         """Hide all artwork display details."""
@@ -130,6 +237,8 @@ class _DetailsPage(QtWidgets.QWidget):
 
     def clear_thumbnail(self) -> None:
         """Hide any artwork thumbnail display."""
+        self._pending_thumbnail = None
+        self._shown_thumbnail = None
         self._thumbnail_switcher.setCurrentWidget(self._no_thumbnail_label)
 
     def set_current_artwork(self, index: QtCore.QModelIndex) -> None:
@@ -139,79 +248,159 @@ class _DetailsPage(QtWidgets.QWidget):
             index: The source Qt index to display.
 
         """
-        self._artwork_line.setText(_get_display(index, art_model.Column.title))
-        self._artist_line.setText(_get_display(index, art_model.Column.artist))
-        self._datetime_line.setText(_get_display(index, art_model.Column.datetime))
-        self._classifaction_line.setText(
-            _get_display(index, art_model.Column.classification)
+        if not _is_details_populated(index):
+            # IMPORTANT: Reading the columns now would query The Met on the GUI
+            # thread. The details are queried elsewhere and, once they arrive, the
+            # pane is refreshed.
+            #
+            self.clear_current_artwork()
+            self._thumbnail_index = QtCore.QPersistentModelIndex()
+            _set_text_if_changed(self._artwork_line, _LOADING_MESSAGE)
+
+            return
+
+        display = _read_columns(
+            index,
+            [
+                art_model.Column.title,
+                art_model.Column.artist,
+                art_model.Column.datetime,
+                art_model.Column.classification,
+                art_model.Column.medium,
+            ],
         )
-        self._medium_line.setText(_get_display(index, art_model.Column.medium))
+        _set_text_if_changed(self._artwork_line, display[art_model.Column.title])
+        _set_text_if_changed(self._artist_line, display[art_model.Column.artist])
+        _set_text_if_changed(self._datetime_line, display[art_model.Column.datetime])
+        _set_text_if_changed(
+            self._classifaction_line, display[art_model.Column.classification]
+        )
+        _set_text_if_changed(self._medium_line, display[art_model.Column.medium])
 
         source = iterbot.get_lowest_source(index.model())
         source_index = iterbot.map_to_source_recursively(index, source)
         thumbnail_index = source_index.siblingAtColumn(art_model.Column.thumbnail)
-        thumbnail: bytes | None = None
 
         if not thumbnail_index.isValid():
             _LOGGER.warning('Index "%s" has no thumbnail index.', source_index)
 
-            self._thumbnail_switcher.setCurrentWidget(self._no_thumbnail_label)
+            self._thumbnail_index = QtCore.QPersistentModelIndex()
+            self.clear_thumbnail()
 
             return
 
-        thumbnail = typing.cast(
-            bytes | None,
-            thumbnail_index.data(art_model.Model.data_role),
+        # NOTE: The thumbnail may still be downloading. Once it's ready, we show it.
+        self._thumbnail_index = QtCore.QPersistentModelIndex(thumbnail_index)
+        source.dataChanged.connect(
+            self._update_thumbnail_if_needed,
+            QtCore.Qt.ConnectionType.UniqueConnection,
         )
+        self._update_thumbnail()
 
-        if not thumbnail:
-            self._thumbnail_switcher.setCurrentWidget(self._no_thumbnail_label)
 
-            return
+class DetailsPane(QtWidgets.QTabWidget):
+    """A QTabWidget that is meant to show artwork."""
 
-        pixmap = self._make_thumbnail_pixmap(thumbnail)
-        self._thumbnail_label.setPixmap(pixmap)
-        self._thumbnail_switcher.setCurrentWidget(self._thumbnail_label)
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        """Keep track of the tabs which haven't been shown yet.
 
+        Args:
+            parent: The GUI that owns this instance, if any.
 
-class DetailsPane(QtWidgets.QTabWidget):
-    """A QTabWidget that is meant to show artwork."""
+        """
+        super().__init__(parent)
+
+        self._pending_indices: dict[int, QtCore.QPersistentModelIndex] = {}
+
+        self.currentChanged.connect(self._materialize)
+
+    def _materialize(self, tab_index: int) -> None:
+        """Build the details of ``tab_index``, if they weren't built already.
+
+        Args:
+            tab_index: A 0-or-more tab to show. -1 means "there are no tabs".
+
+        """
+        persistent = self._pending_indices.pop(tab_index, None)
+
+        if persistent is None or not persistent.isValid():
+            return
+
+        index = persistent.model().index(
+            persistent.row(), persistent.column(), persistent.parent()
+        )
+        placeholder = self.widget(tab_index)
+        placeholder.layout().addWidget(_DetailsPage(index, parent=placeholder))
 
     def set_current_artworks(
         self, indices: typing.Iterable[QtCore.QModelIndex]
     ) -> None:
-        """Clear all existing artworks and populate with ``artworks``.
+        """Show ``indices``, one tab each, re-using this instance's existing tabs.
 
         Args:
             indices: The source Qt indices (Met Artwork) to show.
 
         """
-        self.clear()
+        indices = list(indices)
+        self._pending_indices.clear()
+
+        # NOTE: ``QTabWidget.removeTab`` does not delete the pages so we do it here
+        while self.count() > len(indices):
+            tab_index = self.count() - 1
+            page = self.widget(tab_index)
+            self.removeTab(tab_index)
+            page.deleteLater()
 
         maximum_length = 10
 
-        for index in indices:
-            label = _get_display(index, art_model.Column.title)
+        # PERF: The pane is refreshed whenever any Artwork loads, usually with the
+        # same selection as before. Refreshing the already-built pages (and only
+        # changing text which differs) is much cheaper than rebuilding every tab.
+        #
+        for tab_index, index in enumerate(indices):
+            if _is_details_populated(index):
+                title = _get_sibling(index, art_model.Column.title)
+                label = typing.cast(str, title.data(_DISPLAY_ROLE))
+                tool_tip = typing.cast(
+                    str, title.data(QtCore.Qt.ItemDataRole.ToolTipRole)
+                )
+            else:
+                label = tool_tip = _LOADING_MESSAGE
 
             if len(label) > maximum_length:
                 label = label[:maximum_length] + "..."
 
-            self.addTab(_DetailsPage(index), label)
-            tab_index = self.count() - 1
-            self.setTabToolTip(
-                tab_index,
-                _get_display(
-                    index, art_model.Column.title, QtCore.Qt.ItemDataRole.ToolTipRole
-                ),
-            )
+            if tab_index < self.count():
+                placeholder = self.widget(tab_index)
+                self.setTabText(tab_index, label)
+                self.setTabToolTip(tab_index, tool_tip)
 
+                if page := placeholder.findChild(_DetailsPage):
+                    page.set_current_artwork(index)
+                else:
+                    self._pending_indices[tab_index] = QtCore.QPersistentModelIndex(
+                        index
+                    )
 
-def _get_display(
-    index: QtCore.QModelIndex,
-    column: int,
-    role: QtCore.Qt.ItemDataRole = _DISPLAY_ROLE,
-) -> str:
-    """Get the user-display text starting from ``index``.
+                continue
+
+            # PERF: Only the current tab is visible. So each tab starts as an empty
+            # placeholder and its (expensive) details page is built once it's shown.
+            #
+            placeholder = QtWidgets.QWidget()
+            layout = QtWidgets.QVBoxLayout(placeholder)
+            layout.setContentsMargins(0, 0, 0, 0)
+
+            self._pending_indices[tab_index] = QtCore.QPersistentModelIndex(index)
+            self.addTab(placeholder, label)
+            self.setTabToolTip(tab_index, tool_tip)
+
+        # NOTE: Removing tabs may have switched to a tab which isn't built yet
+        self._materialize(self.currentIndex())
+
+
+def _get_sibling(index: QtCore.QModelIndex, column: int) -> QtCore.QModelIndex:
+    """Get the ``column`` index which is on the same row as ``index``.
 
     Args:
         index: Some source Qt index to look through for data.
@@ -221,7 +410,7 @@ def _get_display(
         RuntimeError: If we cannot resolve a valid index from ``index`` and ``column``.
 
     Returns:
-        The found displayable text.
+        The found sibling.
 
     """
     sibling = index.siblingAtColumn(column)
@@ -231,4 +420,74 @@ def _get_display(
             f'Cannot get display text, "{index} / {column}" has no valid sibling.',
         )
 
-    return typing.cast(str, sibling.data(role))
+    return sibling
+
+
+def _is_details_populated(index: QtCore.QModelIndex) -> bool:
+    """Check if the Artwork of ``index`` can be shown without querying The Met.
+
+    Args:
+        index: Some source Qt index to check.
+
+    Returns:
+        If the Artwork's details are already loaded, return ``True``.
+
+    """
+    artwork = typing.cast(
+        model_type.Artwork | None, index.data(art_model.Model.artwork_role)
+    )
+
+    return artwork is not None and artwork.is_details_populated()
+
+
+def _read_columns(
+    index: QtCore.QModelIndex,
+    columns: typing.Iterable[int],
+    role: QtCore.Qt.ItemDataRole = _DISPLAY_ROLE,
+) -> dict[int, str]:
+    """Get the user-display text of every column in ``columns`` from ``index``'s row.
+
+    Args:
+        index: Some source Qt index to look through for data.
+        columns: The specific data to find. e.g. :obj:`.Column.datetime`.
+        role: The representation of each column to return.
+
+    Raises:
+        RuntimeError: If we cannot resolve a valid index for any of ``columns``.
+
+    Returns:
+        Each column and its displayable text.
+
+    """
+    # PERF: Look up the model / row / parent once instead of once per-column. Each
+    # call crosses the Python <-> C++ boundary, which adds up per-tab.
+    #
+    model = index.model()
+    row = index.row()
+    parent = index.parent()
+    output: dict[int, str] = {}
+
+    for column in columns:
+        sibling = model.index(row, column, parent)
+
+        if not sibling.isValid():
+            raise RuntimeError(
+                f'Cannot get display text, "{index} / {column}" has no valid sibling.',
+            )
+
+        output[column] = typing.cast(str, model.data(sibling, role))
+
+    return output
+
+
+def _set_text_if_changed(line: QtWidgets.QLineEdit, text: str) -> None:
+    """Show ``text`` in ``line`` unless it's already shown.
+
+    Args:
+        line: Some widget to update.
+        text: The text to display.
+
+    """
+    # PERF: ``setText`` always emits signals and repaints, even for the same text
+    if line.text() != text:
+        line.setText(text)
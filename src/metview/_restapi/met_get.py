@@ -1,12 +1,22 @@
 """A really thin wrap around the Met Museum (JSON-based) REST-API."""
 
+import concurrent.futures
+import contextlib
 import functools
+import json
 import logging
 import os
+import sqlite3
+import sys
+import threading
+import time
 import typing
+import zlib
 from urllib import parse
 
 import requests
+from requests import adapters
+from urllib3.util import retry
 
 from . import met_get_type
 
@@ -15,7 +25,19 @@ _TITLE_NOT_FOUND = "<No title>"
 
 # Reference: https://datatracker.ietf.org/doc/html/rfc3986
 _BASE = os.getenv("MET_MUSEUM_API_DOMAIN", "https://collectionapi.metmuseum.org")
+_MAXIMUM_CACHED_DETAILS = 4096
+_MAXIMUM_CONCURRENT_REQUESTS = 16
+_OBJECTS_URL = parse.urljoin(_BASE, "public/collection/v1/objects")
+_SEARCH_URL = parse.urljoin(_BASE, "public/collection/v1/search")
 _SCHEME_SEPARATOR = ":"
+# NOTE: (connect, read) seconds. Searches with many results can take a while to read.
+_TIMEOUT = (3.05, 30)
+_RESPONSE_CACHE_EXPIRATION = 24 * 60 * 60  # NOTE: In seconds
+# NOTE: In seconds. If the cache is busy for longer, skip it instead of waiting.
+_RESPONSE_CACHE_TIMEOUT = 0.25
+_THREAD_DATA = threading.local()
+
+_OptionalText = typing.TypeVar("_OptionalText", str, None)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +95,21 @@ class _SearchResponse(typing.TypedDict):
     objectIDs: list[int]
 
 
+class SearchFilters(typing.NamedTuple):
+    """The normalized filters of a search to The Met.
+
+    Attributes:
+        has_image: If ``True``, only Artwork with images are searched.
+        classification: The type of Artwork to search, if any.
+        text: The lower-case Artwork name to search, if any.
+
+    """
+
+    has_image: bool
+    classification: str
+    text: str
+
+
 class ObjectDetails(typing.NamedTuple):
     """The formatted Met Museum data.
 
@@ -94,6 +131,35 @@ class ObjectDetails(typing.NamedTuple):
     title: str
 
 
+def _connect_response_cache() -> sqlite3.Connection:
+    """Open the on-disk cache of earlier REST API responses.
+
+    Raises:
+        OSError: If the cache's directory cannot be made.
+        sqlite3.Error: If the cache cannot be opened.
+
+    Returns:
+        The opened cache. It's re-used by every later call in the current thread so
+        the caller must not close it.
+
+    """
+    # PERF: Opening a connection is slow relative to a lookup. SQLite connections
+    # can't be shared across threads, so each thread keeps its own, instead.
+    #
+    connections: dict[str, sqlite3.Connection] = _THREAD_DATA.__dict__.setdefault(
+        "connections", {}
+    )
+
+    if connection := connections.get(_RESPONSE_CACHE_PATH):
+        return connection
+
+    _initialize_response_cache(_RESPONSE_CACHE_PATH)
+    connection = sqlite3.connect(_RESPONSE_CACHE_PATH, timeout=_RESPONSE_CACHE_TIMEOUT)
+    connections[_RESPONSE_CACHE_PATH] = connection
+
+    return connection
+
+
 def _get_datetime(year: int | None) -> met_get_type.Datetime | None:
     """Convert ``year`` to a datetime object.
 
@@ -111,41 +177,32 @@ def _get_datetime(year: int | None) -> met_get_type.Datetime | None:
         # NOTE: The Met Museum only tracks year so we just fill in
         # a placeholder for the month and day.
         #
-        return met_get_type.Datetime(year)
+        return met_get_type.get_datetime(year)
     except (ValueError, TypeError):
         _LOGGER.error('Value "%s" could not be converted into a datetime.', year)
 
         return None
 
 
-def _join(text: typing.Iterable[str]) -> str:
-    """Join ``text`` in a way that the Met's REST API can understand.
-
-    Args:
-        text: All items to join.
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the one executor that every Artwork details request shares.
 
     Returns:
-        The formatted, joined output.
+        An executor that allows up to ``_MAXIMUM_CONCURRENT_REQUESTS`` requests.
 
     """
-    return "|".join(text)
-
-
-@functools.lru_cache()
-def get_all_identifiers() -> list[int]:
-    """Find all Met Museum Artwork IDs."""
-    url = parse.urljoin(_BASE, "public/collection/v1/objects")
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        raise ConnectionError(f'URL "{url}" is unreadable. Got "{response}" response.')
-
-    data = typing.cast(_ObjectsResponse, response.json())
-
-    return data["objectIDs"]
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=_MAXIMUM_CONCURRENT_REQUESTS,
+        thread_name_prefix="met_get",
+    )
 
 
-def get_identifier_data(identifier: str | int) -> ObjectDetails:
+# PERF: Re-selecting / re-searching Artwork asks for the same details again. Details
+# are small and immutable so we keep the most recent ones in memory.
+#
+@functools.lru_cache(maxsize=_MAXIMUM_CACHED_DETAILS)
+def _get_identifier_data(identifier: int) -> ObjectDetails:
     """Read all data from Artwork ``identifier``.
 
     Args:
@@ -158,39 +215,166 @@ def get_identifier_data(identifier: str | int) -> ObjectDetails:
         All found data.
 
     """
-    url = parse.urljoin(_BASE, f"public/collection/v1/objects/{identifier}")
-    response = requests.get(url)
-
-    if response.status_code != 200:
-        raise ConnectionError(f'URL "{url}" is unreadable. Got "{response}" response.')
-
-    data = typing.cast(_ObjectDetailsResponse, response.json())
+    url = f"{_OBJECTS_URL}/{identifier}"
+    data = typing.cast(_ObjectDetailsResponse, _get_json(url))
 
+    # PERF: Artist / classification / medium repeat across thousands of Artwork. So
+    # we share one copy of each string instead of keeping a copy per-Artwork. It
+    # also makes the equality checks in filters much cheaper.
+    #
     return ObjectDetails(
-        artist=data.get("artistDisplayName", _ARTIST_NAME_NOT_FOUND),
-        classification=data.get("classification") or None,
+        artist=_intern(data.get("artistDisplayName", _ARTIST_NAME_NOT_FOUND)),
+        classification=_intern(data.get("classification") or None),
         datetime_range=(
             _get_datetime(data.get("objectBeginDate")),
             _get_datetime(data.get("objectEndDate")),
         ),
-        medium=data.get("medium") or None,
+        medium=_intern(data.get("medium") or None),
         thumbnail_url=data.get("primaryImageSmall") or None,
         title=data.get("title", _TITLE_NOT_FOUND),
     )
 
 
-@functools.lru_cache()  # IMPORTANT: This could cause space issues in the future. Audit!
-def search_objects(
-    text: str | None = "",
-    classification: str | None = None,
-    has_image: bool = False,
-) -> list[int]:
-    """Search The Met's database according too all input arguments.
+def _get_json(
+    url: str, params: typing.Sequence[tuple[str, str]] | None = None
+) -> typing.Any:
+    """Read the JSON data of ``url``, re-using a recent response if there is one.
 
     Args:
-        text: Some Artwork name to search by, if any.
-        classification: The allowed types / presentation of the Artwork.
-        has_image: If ``True``, only results with images are returned.
+        url: Some https / http URL to request.
+        params: Any query parameters to add to ``url``.
+
+    Raises:
+        ConnectionError: If ``url`` is unreadable.
+
+    Returns:
+        The decoded JSON data.
+
+    """
+    full_url = typing.cast(
+        str, requests.Request("GET", url, params=params).prepare().url
+    )
+
+    # PERF: The Met's data rarely changes so a response from an earlier session
+    # skips the network entirely.
+    #
+    if (body := _read_cached_response(full_url)) is not None:
+        return json.loads(body)
+
+    try:
+        response = _SESSION.get(url, params=params, timeout=_TIMEOUT)
+    except requests.RequestException as error:
+        # NOTE: Timeouts / retries raise ``requests`` errors, which aren't the
+        # built-in ``ConnectionError`` that every caller expects.
+        #
+        raise ConnectionError(f'URL "{full_url}" is unreadable.') from error
+
+    if response.status_code != 200:
+        raise ConnectionError(
+            f'URL "{full_url}" is unreadable. Got "{response}" response.'
+        )
+
+    _write_cached_response(full_url, response.content)
+
+    # PERF: ``response.json()`` decodes the body to text first, which may include
+    # guessing its encoding. ``json.loads`` reads the UTF-8 bytes directly.
+    #
+    return json.loads(response.content)
+
+
+def _get_response_cache_path() -> str:
+    """Find the file where REST API responses are kept between sessions."""
+    path = os.getenv("METVIEW_RESPONSE_CACHE_PATH")
+
+    if path:
+        return path
+
+    root = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(root, "metview", "responses.sqlite3")
+
+
+@functools.lru_cache(maxsize=1)
+def _initialize_response_cache(path: str) -> None:
+    """Make the on-disk cache at ``path``, if needed, and forget any expired responses.
+
+    Args:
+        path: The absolute path to a SQLite database file.
+
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with contextlib.closing(
+        sqlite3.connect(path, timeout=_RESPONSE_CACHE_TIMEOUT)
+    ) as connection:
+        # PERF: Write-ahead logging lets readers continue while another thread
+        # writes. The setting is saved in the database file itself.
+        #
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, created REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE created < ?",
+                (time.time() - _RESPONSE_CACHE_EXPIRATION,),
+            )
+
+
+def _intern(text: _OptionalText) -> _OptionalText:
+    """Share one copy of ``text`` across every Artwork that has the same value.
+
+    Args:
+        text: Some repeated string, e.g. an artist name or classification.
+
+    Returns:
+        The shared string. If ``text`` is ``None``, ``None`` is returned.
+
+    """
+    if text is None:
+        return None
+
+    return sys.intern(text)
+
+
+def _read_cached_response(url: str) -> bytes | None:
+    """Get the response body of ``url`` from an earlier session, if it's recent.
+
+    Args:
+        url: The full URL, including any query parameters.
+
+    Returns:
+        The cached body or ``None``, if there isn't one or it's unreadable.
+
+    """
+    try:
+        connection = _connect_response_cache()
+        row = connection.execute(
+            "SELECT body FROM responses WHERE url = ? AND created >= ?",
+            (url, time.time() - _RESPONSE_CACHE_EXPIRATION),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return zlib.decompress(row[0])
+    except (OSError, sqlite3.Error, zlib.error):
+        _LOGGER.debug('Unable to read the cached "%s" response.', url, exc_info=True)
+
+        return None
+
+
+# IMPORTANT: Searches can find many IDs. Keep only the most recent searches in memory.
+@functools.lru_cache(maxsize=64)
+def _search_objects(filters: SearchFilters) -> tuple[int, ...]:
+    """Search The Met's database according to ``filters``.
+
+    Args:
+        filters: The normalized text, classification, etc. to search with.
 
     Raises:
         ConnectionError: If no search could be done.
@@ -202,41 +386,233 @@ def search_objects(
     parameters: dict[str, str] = {}
 
     # NOTE: We don't care about the false case so we just don't check for it here.
-    if has_image:
-        parameters["hasImages"] = str(has_image).lower()
+    if filters.has_image:
+        parameters["hasImages"] = str(filters.has_image).lower()
 
-    if classification:
-        parameters["classification"] = classification
+    if filters.classification:
+        parameters["classification"] = filters.classification
 
-    if not parameters and not text:
+    if not parameters and not filters.text:
         # PERF: This query is more efficient and if we don't have any search terms, we
         # might as well get the savings.
         #
         return get_all_identifiers()
 
-    parameters["q"] = text or '""'
-    parsed_url = parse.urlparse(_BASE)
-    path = "/public/collection/v1/search"
+    parameters["q"] = filters.text or '""'
     # Example: https://collectionapi.metmuseum.org/public/collection/v1/search?hasImages=true&medium=Brass&q=%22%22
-    url = parse.urlunparse(
-        (
-            parsed_url.scheme,
-            parsed_url.netloc,
-            path,
-            "",
-            parse.urlencode(parameters),
-            "",
-        )
+    _LOGGER.info('Searching "%s" url with "%s" parameters.', _SEARCH_URL, parameters)
+    # NOTE: Sorted so that the same filters always make the same URL
+    data = typing.cast(
+        _SearchResponse, _get_json(_SEARCH_URL, params=sorted(parameters.items()))
     )
-    _LOGGER.info('Searching "%s" url.', url)
-    response = requests.get(url)
 
-    if response.status_code != 200:
-        raise ConnectionError(
-            f'URL / parameters "{_BASE} / {parameters}" is unreadable. '
-            f'Got "{response}" response.'
-        )
+    # NOTE: The Met returns ``null`` instead of ``[]`` if nothing was found
+    return tuple(data["objectIDs"] or ())
+
+
+def _write_cached_response(url: str, body: bytes) -> None:
+    """Save the response ``body`` of ``url`` so later sessions can re-use it.
+
+    Args:
+        url: The full URL, including any query parameters.
+        body: The raw (JSON) response data.
+
+    """
+    try:
+        with _connect_response_cache() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                # PERF: JSON compresses very well. Keep the cache small on-disk.
+                (url, time.time(), zlib.compress(body)),
+            )
+    except (OSError, sqlite3.Error):
+        # NOTE: e.g. another thread holds the write lock. Caching is optional.
+        _LOGGER.debug('Unable to cache the "%s" response.', url, exc_info=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_all_identifiers() -> tuple[int, ...]:
+    """Find all Met Museum Artwork IDs.
+
+    Returns:
+        Every ID. It's a tuple so that callers can't change the cached result.
+
+    """
+    data = typing.cast(_ObjectsResponse, _get_json(_OBJECTS_URL))
+
+    return tuple(data["objectIDs"] or ())
+
+
+def get_identifier_data(identifier: str | int) -> ObjectDetails:
+    """Read all data from Artwork ``identifier``.
+
+    Args:
+        identifier: Some Met Museum Artwork ID to check.
+
+    Raises:
+        ConnectionError: If no data could be found for ``identifier``.
+
+    Returns:
+        All found data.
+
+    """
+    # NOTE: Convert so that ``"1"`` and ``1`` share the same cached details
+    return _get_identifier_data(int(identifier))
+
+
+def get_identifier_data_many(
+    identifiers: typing.Sequence[int],
+) -> typing.Generator[tuple[int, ObjectDetails | None], None, None]:
+    """Read all data from every Artwork in ``identifiers``, as each one is read.
+
+    Important:
+        The requests share one executor with every other call to this function. So
+        no matter how many threads call this at once, at most
+        ``_MAXIMUM_CONCURRENT_REQUESTS`` requests are in-flight.
+
+    Args:
+        identifiers: Some Met Museum Artwork IDs to check.
+
+    Yields:
+        Each Artwork ID and its data, in the order that they finish. If an
+        identifier could not be read, its data is ``None``.
+
+    """
+    # NOTE: Keep the original order but never request the same Artwork twice
+    identifiers = list(dict.fromkeys(identifiers))
+
+    if not identifiers:
+        return
+
+    # PERF: Each request is mostly network latency so we overlap them instead of
+    # paying one round-trip per-identifier, in serial.
+    #
+    executor = _get_executor()
+    futures = {
+        executor.submit(get_identifier_data, identifier): identifier
+        for identifier in identifiers
+    }
+
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            identifier = futures[future]
+
+            try:
+                details: ObjectDetails | None = future.result()
+            except ConnectionError:
+                _LOGGER.warning('Artwork "%s" could not be read.', identifier)
+                details = None
+            except Exception:
+                _LOGGER.exception('Artwork "%s" could not be queried.', identifier)
+                details = None
+
+            yield identifier, details
+    finally:
+        # NOTE: If the caller stops early, don't send the requests that haven't
+        # started yet. The executor is shared so we cancel only our own requests.
+        #
+        for future in futures:
+            future.cancel()
+
+
+def get_identifiers_data(
+    identifiers: typing.Sequence[int],
+) -> dict[int, ObjectDetails]:
+    """Read all data from every Artwork in ``identifiers`` at once.
+
+    Important:
+        The requests are sent concurrently so this function should be called with
+        reasonably-sized batches. See The Met's rate limits for details.
+
+    Args:
+        identifiers: Some Met Museum Artwork IDs to check.
+
+    Returns:
+        All found data. If an identifier could not be read, it is excluded.
+
+    """
+    return {
+        identifier: details
+        for identifier, details in get_identifier_data_many(identifiers)
+        if details is not None
+    }
+
+
+def get_search_filters(
+    text: str | None = "",
+    classification: str | None = None,
+    has_image: bool = False,
+) -> SearchFilters:
+    """Normalize the search arguments so that equivalent searches compare equal.
+
+    Args:
+        text: Some Artwork name to search by, if any. Searches ignore case.
+        classification: The allowed types / presentation of the Artwork.
+        has_image: If ``True``, only results with images are returned.
+
+    Returns:
+        The normalized filters.
+
+    """
+    return SearchFilters(
+        has_image=has_image,
+        classification=(classification or "").strip(),
+        text=(text or "").strip().casefold(),
+    )
+
+
+def make_session() -> requests.Session:
+    """Make a session that re-uses its connections across The Met's servers.
+
+    Both the REST API and thumbnail downloads use this.
+
+    Returns:
+        A session with connection pooling and automatic retries for busy servers.
+
+    """
+    session = requests.Session()
+    adapter = adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=retry.Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # NOTE: Give back the last response so callers still raise ConnectionError
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def search_objects(
+    text: str | None = "",
+    classification: str | None = None,
+    has_image: bool = False,
+) -> tuple[int, ...]:
+    """Search The Met's database according too all input arguments.
+
+    Args:
+        text: Some Artwork name to search by, if any.
+        classification: The allowed types / presentation of the Artwork.
+        has_image: If ``True``, only results with images are returned.
+
+    Raises:
+        ConnectionError: If no search could be done.
+
+    Returns:
+        The found IDs.
+
+    """
+    # PERF: Equivalent searches (e.g. different letter casing) share one cache entry
+    return _search_objects(get_search_filters(text, classification, has_image))
 
-    data = typing.cast(_SearchResponse, response.json())
 
-    return data["objectIDs"]
+# PERF: Every call re-uses pooled keep-alive connections instead of paying for a
+# new TCP + TLS handshake per-request.
+#
+_SESSION = make_session()
+_RESPONSE_CACHE_PATH = _get_response_cache_path()
@@ -1,9 +1,8 @@
 """Any simple Python type to re-use in other modules."""
 
-import functools
+import weakref
 
 
-@functools.total_ordering
 class Datetime:
     """Some really simple datetime proxy object.
 
@@ -13,6 +12,8 @@ class Datetime:
 
     """
 
+    __slots__ = ("_year", "__weakref__")
+
     def __init__(self, year: int) -> None:
         """Keep track of ``year`` for later.
 
@@ -38,11 +39,59 @@ class Datetime:
             If ``other`` is the same datetime, return ``True``.
 
         """
+        # PERF: Every comparison is written out (instead of
+        # ``functools.total_ordering``) so that each one is a single call.
+        #
         if not isinstance(other, Datetime):
-            return False
+            return NotImplemented
 
         return self._year == other._year
 
+    def __ge__(self, other: object) -> bool:
+        """Check if this instance comes after or with ``other`` in a sorting function.
+
+        Args:
+            other: Some other Datetime to check.
+
+        Returns:
+            If this instance must not come before ``other``, return ``True``.
+
+        """
+        if not isinstance(other, Datetime):
+            return NotImplemented
+
+        return self._year >= other._year
+
+    def __gt__(self, other: object) -> bool:
+        """Check if this instance comes after ``other`` in a sorting function.
+
+        Args:
+            other: Some other Datetime to check.
+
+        Returns:
+            If this instance must come after ``other``, return ``True``.
+
+        """
+        if not isinstance(other, Datetime):
+            return NotImplemented
+
+        return self._year > other._year
+
+    def __le__(self, other: object) -> bool:
+        """Check if this instance comes before or with ``other`` in a sorting function.
+
+        Args:
+            other: Some other Datetime to check.
+
+        Returns:
+            If this instance must not come after ``other``, return ``True``.
+
+        """
+        if not isinstance(other, Datetime):
+            return NotImplemented
+
+        return self._year <= other._year
+
     def __lt__(self, other: object) -> bool:
         """Check if this instance comes before ``other`` in a sorting function.
 
@@ -54,7 +103,7 @@ class Datetime:
 
         """
         if not isinstance(other, Datetime):
-            return False
+            return NotImplemented
 
         return self._year < other._year
 
@@ -67,4 +116,26 @@ class Datetime:
         return str(self._year)
 
 
+# PERF: Many Artworks share the same years so we share the same Datetime, too.
+_DATETIMES: weakref.WeakValueDictionary[int, Datetime] = weakref.WeakValueDictionary()
+
 DatetimeRange = tuple[Datetime | None, Datetime | None]
+
+
+def get_datetime(year: int) -> Datetime:
+    """Get the (shared) Datetime for ``year``.
+
+    Args:
+        year: The B.C. / A.D. year to keep track of. e.g. ``2025`` or ``-100``.
+
+    Returns:
+        The Datetime. Every caller that asks for the same ``year`` gets the same
+        instance, as long as someone still holds a reference to it.
+
+    """
+    datetime = _DATETIMES.get(year)
+
+    if datetime is None:
+        datetime = _DATETIMES.setdefault(year, Datetime(year))
+
+    return datetime
@@ -1,6 +1,24 @@
 """Initialize Qt so that we can use it in unittests."""
 
-from PySide6 import QtWidgets
+import functools
 
-# IMPORTANT: We need a QApplication or unittests cannot run. Do not remove this line.
-_APPLICATION = QtWidgets.QApplication([])
+from PySide6 import QtCore
+
+
+@functools.lru_cache(maxsize=1)
+def get_application() -> QtCore.QCoreApplication:
+    """Get a QApplication, creating it the first time a test module needs it.
+
+    Tests that don't use Qt (e.g. :mod:`tests.test_cli`) never call this function so
+    they don't pay for Qt's platform startup.
+
+    Returns:
+        The one application that every test shares.
+
+    """
+    # IMPORTANT: Imported here because loading the widget module is part of the
+    # startup cost that non-Qt tests should not pay for.
+    #
+    from PySide6 import QtWidgets  # pylint: disable=import-outside-toplevel
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,209 @@
+"""Make sure :mod:`metview._gui.models.art_model` shows rows as expected."""
+
+import unittest
+from unittest import mock
+
+from PySide6 import QtCore
+
+from metview._gui.models import art_model
+from metview._restapi import met_get, met_get_type
+
+from . import get_application
+
+
+class FetchMore(unittest.TestCase):
+    """Make sure :class:`metview._gui.models.art_model.Model` pages its rows."""
+
+    def test_empty(self) -> None:
+        """Don't fetch anything if there's nothing to fetch."""
+        model = art_model.Model()
+
+        self.assertEqual(0, model.rowCount())
+        self.assertFalse(model.canFetchMore())
+
+    def test_pages(self) -> None:
+        """Show rows in batches until every Artwork ID is shown."""
+        model = art_model.Model(identifiers=list(range(450)))
+
+        self.assertEqual(200, model.rowCount())
+        self.assertTrue(model.canFetchMore())
+
+        model.fetchMore()
+        self.assertEqual(400, model.rowCount())
+
+        model.fetchMore()
+        self.assertEqual(450, model.rowCount())
+        self.assertFalse(model.canFetchMore())
+
+    def test_reset(self) -> None:
+        """Start from the first batch again after new Artwork IDs are given."""
+        model = art_model.Model(identifiers=list(range(450)))
+        model.fetchMore()
+
+        model.update_artwork_identifiers(list(range(1000, 1100)))
+
+        self.assertEqual(100, model.rowCount())
+        self.assertFalse(model.canFetchMore())
+
+
+class Data(unittest.TestCase):
+    """Make sure :meth:`metview._gui.models.art_model.Model.data` shows Artwork."""
+
+    def test_datetime(self) -> None:
+        """Show B.C. / A.D. years and year ranges."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        ranges = [
+            (met_get_type.Datetime(-100), met_get_type.Datetime(-100)),
+            (met_get_type.Datetime(-100), met_get_type.Datetime(20)),
+            (None, None),
+        ]
+
+        for row, datetime_range in enumerate(ranges):
+            index = model.index(row, art_model.Column.datetime)
+            model.data(index, model.artwork_role).set_details(
+                _make_details(datetime_range)
+            )
+
+        self.assertEqual(
+            ["100 B.C.", "100 B.C. - 20", "<No Datetime>"],
+            [model.index(row, art_model.Column.datetime).data() for row in range(3)],
+        )
+
+    def test_missing(self) -> None:
+        """Show placeholder text for Artwork without a title / artist."""
+        model = art_model.Model(identifiers=[1])
+        index = model.index(0, art_model.Column.title)
+        model.data(index, model.artwork_role).set_details(_make_details((None, None)))
+
+        self.assertEqual("<No title found>", index.data())
+        self.assertEqual("", index.data(model.data_role))
+        self.assertEqual(
+            "<No artist found>", index.siblingAtColumn(art_model.Column.artist).data()
+        )
+
+
+def _make_details(datetime_range: met_get_type.DatetimeRange) -> met_get.ObjectDetails:
+    """Make some placeholder Artwork data created within ``datetime_range``."""
+    return met_get.ObjectDetails(
+        artist="",
+        classification=None,
+        datetime_range=datetime_range,
+        medium=None,
+        thumbnail_url=None,
+        title="",
+    )
+
+
+class Cache(unittest.TestCase):
+    """Make sure :class:`metview._gui.models.art_model.Model` bounds its memory."""
+
+    def test_evict(self) -> None:
+        """Forget the least recently used Artwork once the cache is full."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        model.set_cache_size(2)
+        first = model.index(0, 0).data(model.artwork_role)
+        model.index(1, 0).data(model.artwork_role)
+
+        self.assertIs(first, model.index(0, 0).data(model.artwork_role))
+
+        model.index(2, 0).data(model.artwork_role)
+
+        self.assertEqual(
+            [1, 3],
+            [artwork.get_identifier() for artwork in model._cache.values()],
+        )
+
+    def test_evict_thumbnails(self) -> None:
+        """Forget the least recently used thumbnails once the cache is full."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        model.set_thumbnail_cache_size(2)
+
+        for identifier in [1, 2, 3]:
+            model._set_thumbnail_data(identifier, b"")
+
+        self.assertEqual([2, 3], list(model._thumbnails))
+
+    def test_invalid_size(self) -> None:
+        """Don't allow caches that can't hold anything."""
+        with self.assertRaises(ValueError):
+            art_model.Model().set_cache_size(0)
+
+        with self.assertRaises(ValueError):
+            art_model.Model().set_thumbnail_cache_size(0)
+
+
+class UpdateArtworkIdentifiers(unittest.TestCase):
+    """Make sure :class:`metview._gui.models.art_model.Model` keeps rows if it can."""
+
+    def test_append(self) -> None:
+        """Keep existing rows when new Artwork IDs are only added at the end."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        index = QtCore.QPersistentModelIndex(model.index(1, 0))
+
+        with mock.patch.object(model, "beginResetModel") as reset:
+            model.update_artwork_identifiers([1, 2, 3, 4])
+
+        reset.assert_not_called()
+        self.assertEqual(4, model.rowCount())
+        self.assertEqual(1, index.row())
+
+    def test_reorder(self) -> None:
+        """Move existing rows when the same Artwork IDs are given in a new order."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        index = QtCore.QPersistentModelIndex(model.index(0, 0))
+
+        with mock.patch.object(model, "beginResetModel") as reset:
+            model.update_artwork_identifiers([3, 2, 1])
+
+        reset.assert_not_called()
+        self.assertEqual(2, index.row())
+
+    def test_replace(self) -> None:
+        """Reset the model when the Artwork IDs are different."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        index = QtCore.QPersistentModelIndex(model.index(0, 0))
+
+        model.update_artwork_identifiers([4, 5])
+
+        self.assertEqual(2, model.rowCount())
+        self.assertFalse(index.isValid())
+
+
+class UpdateArtworkDetails(unittest.TestCase):
+    """Make sure :class:`metview._gui.models.art_model.Model` shows queried details."""
+
+    def test_details(self) -> None:
+        """Show found details and use placeholders for any unreadable Artwork."""
+        model = art_model.Model(identifiers=[1, 2, 3])
+        changed: list[tuple[int, int]] = []
+        model.dataChanged.connect(
+            lambda top_left, bottom_right: changed.append(
+                (top_left.row(), bottom_right.row())
+            )
+        )
+        details = _make_details((None, None))._replace(title="Found")
+
+        model.update_artwork_details({2: details, 3: None})
+
+        self.assertEqual([(1, 2)], changed)
+        self.assertEqual("Found", model.index(1, art_model.Column.title).data())
+        self.assertEqual(
+            "<No title found>", model.index(2, art_model.Column.title).data()
+        )
+
+
+class GetRuns(unittest.TestCase):
+    """Make sure downloaded thumbnail rows are grouped correctly."""
+
+    def test_runs(self) -> None:
+        """Collapse consecutive rows into one range."""
+        self.assertEqual([], art_model._get_runs([]))
+        self.assertEqual([(4, 4)], art_model._get_runs([4]))
+        self.assertEqual(
+            [(1, 3), (7, 8), (10, 10)], art_model._get_runs([1, 2, 3, 7, 8, 10])
+        )
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    """Every test in this module needs Qt to be running."""
+    get_application()
@@ -0,0 +1,61 @@
+"""Make sure :mod:`metview._gui.utility_widgets.details_pane` shows Artwork."""
+
+import unittest
+
+from metview._gui.models import art_model
+from metview._gui.utility_widgets import details_pane
+from metview._restapi import met_get
+
+from . import get_application
+
+
+class SetCurrentArtworks(unittest.TestCase):
+    """Make sure :meth:`.DetailsPane.set_current_artworks` shows every Artwork."""
+
+    def test_loading(self) -> None:
+        """Show a placeholder for Artwork which hasn't been queried yet."""
+        # pylint: disable=protected-access
+        model = art_model.Model(identifiers=[1])
+        pane = details_pane.DetailsPane()
+        pane.set_current_artworks([model.index(0, 0)])
+
+        self.assertEqual(details_pane._LOADING_MESSAGE, pane.tabText(0))
+
+    def test_reuse(self) -> None:
+        """Refresh the already-built tabs instead of making new ones."""
+        # pylint: disable=protected-access
+        model = art_model.Model(identifiers=[1, 2, 3])
+
+        for row, title in enumerate(["Horse", "Cat", "Dog"]):
+            index = model.index(row, 0)
+            model.data(index, model.artwork_role).set_details(_make_details(title))
+
+        pane = details_pane.DetailsPane()
+        pane.set_current_artworks([model.index(0, 0), model.index(1, 0)])
+        placeholder = pane.widget(0)
+        page = placeholder.findChild(details_pane._DetailsPage)
+
+        pane.set_current_artworks([model.index(2, 0)])
+
+        self.assertEqual(1, pane.count())
+        self.assertIs(placeholder, pane.widget(0))
+        self.assertIs(page, placeholder.findChild(details_pane._DetailsPage))
+        self.assertEqual("Dog", pane.tabText(0))
+        self.assertEqual("Dog", page._artwork_line.text())
+
+
+def _make_details(title: str) -> met_get.ObjectDetails:
+    """Make some placeholder Artwork data called ``title``."""
+    return met_get.ObjectDetails(
+        artist="",
+        classification=None,
+        datetime_range=(None, None),
+        medium=None,
+        thumbnail_url=None,
+        title=title,
+    )
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    """Every test in this module needs Qt to be running."""
+    get_application()
@@ -0,0 +1,164 @@
+"""Make sure :mod:`metview._gui.gui` shows and searches Artwork as expected."""
+
+import unittest
+from unittest import mock
+
+import shiboken6
+from PySide6 import QtCore
+
+from metview._gui import gui
+from metview._gui.models import art_model
+from metview._gui.utilities import threader
+from metview._restapi import met_get, met_get_type
+
+from . import get_application
+
+
+class ArtworkSortFilterProxy(unittest.TestCase):
+    """Make sure :class:`metview._gui.gui._ArtworkSortFilterProxy` sorts Artwork."""
+
+    def test_datetime(self) -> None:
+        """Sort by start year, then end year, with missing years last."""
+        ranges = [
+            (None, None),
+            (20, None),
+            (-100, 50),
+            (-100, 20),
+            (20, 30),
+        ]
+        model = art_model.Model(identifiers=list(range(len(ranges))))
+
+        for row, (begin, end) in enumerate(ranges):
+            index = model.index(row, art_model.Column.datetime)
+            model.data(index, model.artwork_role).set_details(
+                _make_details((_get_datetime(begin), _get_datetime(end)))
+            )
+
+        sorter = gui._ArtworkSortFilterProxy()  # pylint: disable=protected-access
+        sorter.setSourceModel(model)
+        sorter.sort(art_model.Column.datetime)
+
+        self.assertEqual(
+            [3, 2, 4, 1, 0],
+            [
+                sorter.mapToSource(sorter.index(row, 0)).row()
+                for row in range(sorter.rowCount())
+            ],
+        )
+
+    def test_datetime_unloaded(self) -> None:
+        """Sort unloaded Artwork last without querying The Met for them."""
+        model = art_model.Model(identifiers=list(range(50)))
+        index = model.index(49, art_model.Column.datetime)
+        model.data(index, model.artwork_role).set_details(
+            _make_details((_get_datetime(20), None))
+        )
+        masker = gui._MaskedDataProxy()  # pylint: disable=protected-access
+        masker.setSourceModel(model)
+        sorter = gui._ArtworkSortFilterProxy()  # pylint: disable=protected-access
+        sorter.setSourceModel(masker)
+
+        with mock.patch.object(met_get, "get_identifier_data") as patch:
+            sorter.sort(art_model.Column.datetime)
+
+        patch.assert_not_called()
+        self.assertEqual(49, sorter.mapToSource(sorter.index(0, 0)).row())
+
+
+class CropProxy(unittest.TestCase):
+    """Make sure :class:`metview._gui.gui._CropProxy` never shows too many rows."""
+
+    def test_append(self) -> None:
+        """Keep the whole proxy chain cropped when the source gets more rows."""
+        model = art_model.Model(identifiers=list(range(50)))
+        cropper = gui._CropProxy()  # pylint: disable=protected-access
+        cropper.setSourceModel(model)
+        masker = gui._MaskedDataProxy()  # pylint: disable=protected-access
+        masker.setSourceModel(cropper)
+        sorter = gui._ArtworkSortFilterProxy()  # pylint: disable=protected-access
+        sorter.setSourceModel(masker)
+
+        self.assertEqual(50, sorter.rowCount())
+
+        model.update_artwork_identifiers(list(range(300)))
+
+        self.assertEqual(250, model.rowCount())
+        self.assertEqual(80, cropper.rowCount())
+        self.assertEqual(80, masker.rowCount())
+        self.assertEqual(80, sorter.rowCount())
+        self.assertFalse(sorter.canFetchMore(QtCore.QModelIndex()))
+
+    def test_hidden_columns(self) -> None:
+        """Allow hidden source columns to be looked up through the crop."""
+        model = art_model.Model(identifiers=list(range(10)))
+        cropper = gui._CropProxy()  # pylint: disable=protected-access
+        cropper.setSourceModel(model)
+
+        index = cropper.index(0, 0).siblingAtColumn(art_model.Column.thumbnail)
+
+        self.assertTrue(index.isValid())
+        self.assertEqual(
+            model.index(0, art_model.Column.thumbnail), cropper.mapToSource(index)
+        )
+
+
+class Widget(unittest.TestCase):
+    """Make sure :class:`metview._gui.gui.Widget` never blocks on The Met."""
+
+    def test_finished_search(self) -> None:
+        """Keep a finished search alive until its results are delivered."""
+        # pylint: disable=protected-access
+        with mock.patch.object(met_get, "get_all_identifiers", return_value=[1, 2]):
+            widget = gui.Widget()
+            threader.get_network_pool().waitForDone()
+
+        worker = widget._current_search
+        self.assertIsNotNone(worker)
+        self.assertTrue(shiboken6.isValid(worker))
+
+        widget._stop_current_search()
+        QtCore.QCoreApplication.processEvents()
+
+        self.assertEqual(set(), widget._search_workers)
+
+    def test_has_image_unloaded(self) -> None:
+        """Keep unloaded Artwork without querying The Met for their thumbnails."""
+        # pylint: disable=protected-access
+        model = art_model.Model(identifiers=list(range(50)))
+
+        with mock.patch.object(gui.Widget, "_search"):
+            widget = gui.Widget(model=model)
+
+        widget._filter_missing_image_check_box.setChecked(True)
+        sorter = widget._artwork_view.model()
+
+        with mock.patch.object(met_get, "get_identifier_data") as patch:
+            sorter.invalidate()
+
+        patch.assert_not_called()
+        self.assertEqual(50, sorter.rowCount())
+
+
+def _get_datetime(year: int | None) -> met_get_type.Datetime | None:
+    """Get the Datetime of ``year``, if any."""
+    if year is None:
+        return None
+
+    return met_get_type.get_datetime(year)
+
+
+def _make_details(datetime_range: met_get_type.DatetimeRange) -> met_get.ObjectDetails:
+    """Make some placeholder Artwork data created within ``datetime_range``."""
+    return met_get.ObjectDetails(
+        artist="",
+        classification=None,
+        datetime_range=datetime_range,
+        medium=None,
+        thumbnail_url=None,
+        title="",
+    )
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    """Every test in this module needs Qt to be running."""
+    get_application()
@@ -0,0 +1,225 @@
+"""Make sure :mod:`metview._restapi.met_get` queries The Met as expected."""
+
+import contextlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from metview._restapi import met_get
+
+
+class GetDatetime(unittest.TestCase):
+    """Make sure :func:`metview._restapi.met_get._get_datetime` works."""
+
+    def test_shared(self) -> None:
+        """Re-use the same Datetime for the same year."""
+        get = met_get._get_datetime  # pylint: disable=protected-access
+        first = get(-100)
+
+        self.assertIs(first, get(-100))
+        self.assertNotEqual(first, get(20))
+        self.assertLess(first, get(20))
+        self.assertLessEqual(first, get(-100))
+        self.assertGreater(get(20), first)
+        self.assertGreaterEqual(get(20), get(20))
+
+    def test_other_types(self) -> None:
+        """Don't pretend that a Datetime can be ordered with other types."""
+        datetime = met_get._get_datetime(20)  # pylint: disable=protected-access
+
+        self.assertNotEqual(datetime, 20)
+        self.assertNotEqual(datetime, None)
+
+        with self.assertRaises(TypeError):
+            datetime < 20  # pylint: disable=pointless-statement
+
+        with self.assertRaises(TypeError):
+            datetime >= None  # pylint: disable=pointless-statement
+
+
+class GetIdentifierDataMany(unittest.TestCase):
+    """Make sure :func:`metview._restapi.met_get.get_identifier_data_many` works."""
+
+    def test_duplicates(self) -> None:
+        """Read each Artwork only once, even if it is requested more than once."""
+        with mock.patch.object(
+            met_get, "get_identifier_data", side_effect=_make_details
+        ) as patch:
+            found = [
+                identifier
+                for identifier, _ in met_get.get_identifier_data_many([1, 2, 1])
+            ]
+
+        self.assertEqual([1, 2], sorted(found))
+        self.assertEqual(2, patch.call_count)
+
+    def test_shared_limit(self) -> None:
+        """Never exceed the request limit, even across concurrent callers."""
+        lock = threading.Lock()
+        counts = {"current": 0, "maximum": 0}
+
+        def _get_identifier_data(identifier: int) -> met_get.ObjectDetails:
+            with lock:
+                counts["current"] += 1
+                counts["maximum"] = max(counts["maximum"], counts["current"])
+
+            time.sleep(0.01)
+
+            with lock:
+                counts["current"] -= 1
+
+            return _make_details(str(identifier))
+
+        def _read(identifiers: list[int]) -> None:
+            list(met_get.get_identifier_data_many(identifiers))
+
+        threads = [
+            threading.Thread(target=_read, args=(list(range(start, start + 40)),))
+            for start in range(0, 160, 40)
+        ]
+
+        with mock.patch.object(met_get, "get_identifier_data", _get_identifier_data):
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertLessEqual(
+            counts["maximum"],
+            met_get._MAXIMUM_CONCURRENT_REQUESTS,  # pylint: disable=protected-access
+        )
+
+    def test_unreadable(self) -> None:
+        """Report Artwork that could not be read as ``None``."""
+
+        def _get_identifier_data(identifier: int) -> met_get.ObjectDetails:
+            if identifier == 2:
+                raise ConnectionError("Not readable")
+
+            return _make_details(str(identifier))
+
+        with mock.patch.object(met_get, "get_identifier_data", _get_identifier_data):
+            found = dict(met_get.get_identifier_data_many([1, 2, 3]))
+
+        self.assertEqual(
+            {1: _make_details("1"), 2: None, 3: _make_details("3")},
+            found,
+        )
+
+
+class GetIdentifiersData(unittest.TestCase):
+    """Make sure :func:`metview._restapi.met_get.get_identifiers_data` works."""
+
+    def test_empty(self) -> None:
+        """Don't query anything if there's nothing to query."""
+        with mock.patch.object(met_get, "get_identifier_data") as patch:
+            self.assertEqual({}, met_get.get_identifiers_data([]))
+
+        patch.assert_not_called()
+
+    def test_skip_unreadable(self) -> None:
+        """Exclude any Artwork that could not be read."""
+
+        def _get_identifier_data(identifier: int) -> met_get.ObjectDetails:
+            if identifier == 2:
+                raise ConnectionError("Not readable")
+
+            return _make_details(str(identifier))
+
+        with mock.patch.object(met_get, "get_identifier_data", _get_identifier_data):
+            found = met_get.get_identifiers_data([1, 2, 3])
+
+        self.assertEqual({1: _make_details("1"), 3: _make_details("3")}, found)
+
+
+class SearchObjects(unittest.TestCase):
+    """Make sure :func:`metview._restapi.met_get.search_objects` works."""
+
+    def setUp(self) -> None:
+        """Don't let searches from other tests / sessions affect this one."""
+        met_get._search_objects.cache_clear()  # pylint: disable=protected-access
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(
+            met_get,
+            "_RESPONSE_CACHE_PATH",
+            os.path.join(directory.name, "responses.sqlite3"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_on_disk(self) -> None:
+        """Re-use a search from an earlier session instead of querying again."""
+        response = _make_search_response([1, 2])
+        session = met_get._SESSION  # pylint: disable=protected-access
+
+        with mock.patch.object(session, "get", return_value=response) as get:
+            self.assertEqual((1, 2), met_get.search_objects("Horse"))
+            met_get._search_objects.cache_clear()  # pylint: disable=protected-access
+            self.assertEqual((1, 2), met_get.search_objects("Horse"))
+
+        get.assert_called_once()
+
+    def test_cache_busy(self) -> None:
+        """Still return the search when another thread is writing to the cache."""
+        response = _make_search_response([1, 2])
+        session = met_get._SESSION  # pylint: disable=protected-access
+        path = met_get._RESPONSE_CACHE_PATH  # pylint: disable=protected-access
+        met_get._initialize_response_cache(path)  # pylint: disable=protected-access
+
+        with contextlib.closing(sqlite3.connect(path)) as writer:
+            writer.execute("BEGIN EXCLUSIVE")
+
+            with mock.patch.object(session, "get", return_value=response):
+                self.assertEqual((1, 2), met_get.search_objects("Horse"))
+
+    def test_connection_reused(self) -> None:
+        """Open the cache only once per-thread."""
+        # pylint: disable=protected-access
+        self.assertIs(
+            met_get._connect_response_cache(), met_get._connect_response_cache()
+        )
+
+    def test_equivalent(self) -> None:
+        """Only query once for searches that differ by case / whitespace."""
+        response = _make_search_response([1, 2])
+
+        session = met_get._SESSION  # pylint: disable=protected-access
+
+        with mock.patch.object(session, "get", return_value=response) as get:
+            self.assertEqual((1, 2), met_get.search_objects("Horse", "Paintings"))
+            self.assertEqual((1, 2), met_get.search_objects(" horse ", "Paintings "))
+
+        get.assert_called_once()
+        self.assertEqual(
+            [("classification", "Paintings"), ("q", "horse")],
+            get.call_args.kwargs["params"],
+        )
+
+
+def _make_details(title: str) -> met_get.ObjectDetails:
+    """Make some placeholder Artwork data called ``title``."""
+    return met_get.ObjectDetails(
+        artist="",
+        classification=None,
+        datetime_range=(None, None),
+        medium=None,
+        thumbnail_url=None,
+        title=title,
+    )
+
+
+def _make_search_response(identifiers: list[int]) -> mock.Mock:
+    """Make a fake, successful REST API response that found ``identifiers``."""
+    data = {"total": len(identifiers), "objectIDs": identifiers}
+    response = mock.Mock(status_code=200, content=json.dumps(data).encode("utf-8"))
+    response.json.return_value = data
+
+    return response
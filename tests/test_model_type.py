@@ -0,0 +1,118 @@
+"""Make sure :mod:`metview._gui.models.model_type` reads and caches Artwork safely."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from metview._gui.models import model_type
+from metview._restapi import met_get
+
+
+class EvictCachedThumbnails(unittest.TestCase):
+    """Make sure old thumbnails are deleted without breaking in-progress writes."""
+
+    def setUp(self) -> None:
+        """Keep every thumbnail in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self._directory = directory.name
+
+        for patcher in [
+            mock.patch.object(model_type, "_MAXIMUM_CACHED_THUMBNAILS", 1),
+            mock.patch.object(
+                model_type,
+                "_get_thumbnail_cache_directory",
+                return_value=self._directory,
+            ),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _make_files(self, names: list[str]) -> None:
+        """Write ``names`` as thumbnails, oldest first."""
+        for offset, name in enumerate(names):
+            path = os.path.join(self._directory, name)
+
+            with open(path, "wb") as handler:
+                handler.write(b"data")
+
+            modified = time.time() - 100 + offset
+            os.utime(path, (modified, modified))
+
+    def test_skip_temporary(self) -> None:
+        """Never delete another thread's thumbnail before it is done writing."""
+        self._make_files(["a.partial", "b", "c"])
+
+        model_type._evict_cached_thumbnails()  # pylint: disable=protected-access
+
+        self.assertEqual(["a.partial", "c"], sorted(os.listdir(self._directory)))
+
+    def test_vanished(self) -> None:
+        """Skip thumbnails that another thread deletes while evicting."""
+        self._make_files(["a", "b", "c"])
+        scandir = os.scandir
+
+        def _scandir(path: str) -> list[os.DirEntry[str]]:
+            entries = list(scandir(path))
+            os.remove(os.path.join(path, "a"))
+
+            return entries
+
+        with mock.patch.object(model_type.os, "scandir", _scandir):
+            model_type._evict_cached_thumbnails()  # pylint: disable=protected-access
+
+        self.assertEqual(["c"], os.listdir(self._directory))
+
+
+class PrecomputeDetails(unittest.TestCase):
+    """Make sure :meth:`.Artwork.precompute_details` never raises for bad requests."""
+
+    def setUp(self) -> None:
+        """Don't let responses from other tests / sessions affect this one."""
+        met_get._get_identifier_data.cache_clear()  # pylint: disable=protected-access
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(
+            met_get,
+            "_RESPONSE_CACHE_PATH",
+            os.path.join(directory.name, "responses.sqlite3"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_timeout(self) -> None:
+        """Show placeholder details if The Met takes too long to respond."""
+        artwork = model_type.Artwork(1)
+        session = met_get._SESSION  # pylint: disable=protected-access
+
+        with mock.patch.object(session, "get", side_effect=requests.Timeout):
+            artwork.precompute_details()
+
+        self.assertTrue(artwork.is_details_populated())
+        self.assertEqual(
+            model_type._PLACEHOLDER_DETAILS,  # pylint: disable=protected-access
+            artwork._resolved,  # pylint: disable=protected-access
+        )
+
+
+class ReadThumbnailData(unittest.TestCase):
+    """Make sure :func:`.model_type._read_thumbnail_data` reports bad requests."""
+
+    def test_timeout(self) -> None:
+        """Report thumbnails that take too long as unreadable."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        session = model_type._SESSION  # pylint: disable=protected-access
+
+        with mock.patch.object(
+            model_type, "_get_thumbnail_cache_directory", return_value=directory.name
+        ), mock.patch.object(session, "get", side_effect=requests.ConnectTimeout):
+            with self.assertRaises(ConnectionError):
+                model_type._read_thumbnail_data(  # pylint: disable=protected-access
+                    "https://images.metmuseum.org/thumbnail.jpg"
+                )
@@ -0,0 +1,165 @@
+"""Make sure :mod:`metview._gui.utilities.threader` workers report as expected."""
+
+import unittest
+from unittest import mock
+
+from PySide6 import QtCore, QtGui
+
+from metview._gui.utilities import threader
+from metview._restapi import met_get
+
+from . import get_application
+
+
+class ArtSearchWorker(unittest.TestCase):
+    """Make sure searches are reported from another thread."""
+
+    def test_run(self) -> None:
+        """Report the found IDs and then finish."""
+        found: list[list[int]] = []
+        finished: list[bool] = []
+        worker = threader.ArtSearchWorker(lambda: [1, 2])
+        worker.identifiers_found.connect(found.append)
+        worker.finished.connect(lambda: finished.append(True))
+
+        worker.run()
+
+        self.assertEqual([[1, 2]], found)
+        self.assertEqual([True], finished)
+
+    def test_stop_before_run(self) -> None:
+        """Don't search if the worker was stopped while it was still queued."""
+        query = mock.Mock(return_value=[1, 2])
+        found: list[list[int]] = []
+        finished: list[bool] = []
+        worker = threader.ArtSearchWorker(query)
+        worker.identifiers_found.connect(found.append)
+        worker.finished.connect(lambda: finished.append(True))
+        worker.request_stop.emit()
+
+        worker.run()
+
+        query.assert_not_called()
+        self.assertEqual([], found)
+        self.assertEqual([True], finished)
+
+    def test_signals(self) -> None:
+        """Define every signal exactly once."""
+        meta = threader.ArtSearchWorker.staticMetaObject
+        signals = [
+            meta.method(index).name().data().decode("utf-8")
+            for index in range(meta.methodOffset(), meta.methodCount())
+            if meta.method(index).methodType() == QtCore.QMetaMethod.MethodType.Signal
+        ]
+
+        self.assertEqual(
+            ["errored", "finished", "identifiers_found", "request_stop"],
+            sorted(signals),
+        )
+
+
+class QueryArtworkDetailsWorker(unittest.TestCase):
+    """Make sure Artwork details are queried and reported from another thread."""
+
+    def test_run(self) -> None:
+        """Report every Artwork, including the ones that could not be read."""
+
+        def _get_identifier_data(identifier: int) -> met_get.ObjectDetails:
+            if identifier == 2:
+                raise ConnectionError("Not readable")
+
+            return details
+
+        details = mock.Mock()
+        found: list[dict[int, met_get.ObjectDetails | None]] = []
+        worker = threader.QueryArtworkDetailsWorker([1, 2])
+        worker.details_found.connect(found.append)
+
+        with mock.patch.object(met_get, "get_identifier_data", _get_identifier_data):
+            worker.run()
+
+        self.assertEqual([{1: details, 2: None}], found)
+
+    def test_stop(self) -> None:
+        """Don't query or report anything once the worker is stopped."""
+        found: list[dict[int, met_get.ObjectDetails | None]] = []
+        throttle = mock.Mock()
+        worker = threader.QueryArtworkDetailsWorker([1, 2], throttle=throttle)
+        worker.details_found.connect(found.append)
+        throttle.side_effect = lambda _: worker.request_stop.emit()
+
+        with mock.patch.object(met_get, "get_identifier_data") as patch:
+            worker.run()
+
+        patch.assert_not_called()
+        self.assertEqual([], found)
+
+    def test_stop_before_run(self) -> None:
+        """Don't query anything if the worker was stopped while it was still queued."""
+        found: list[dict[int, met_get.ObjectDetails | None]] = []
+        throttle = mock.Mock()
+        worker = threader.QueryArtworkDetailsWorker([1, 2], throttle=throttle)
+        worker.details_found.connect(found.append)
+        worker.request_stop.emit()
+
+        with mock.patch.object(met_get, "get_identifier_data") as patch:
+            worker.run()
+
+        throttle.assert_not_called()
+        patch.assert_not_called()
+        self.assertEqual([], found)
+
+
+class ThumbnailWorker(unittest.TestCase):
+    """Make sure downloaded thumbnails are reported from another thread."""
+
+    def test_already_small(self) -> None:
+        """Report small thumbnails exactly as they were downloaded."""
+        image = QtGui.QImage(100, 100, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("red"))
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "BMP")
+        thumbnail = data.data()
+
+        artwork = mock.Mock()
+        artwork.get_identifier.return_value = 1
+        artwork.get_thumbnail_data.return_value = thumbnail
+        found: list[bytes] = []
+        worker = threader.ThumbnailWorker(artwork)
+        worker.thumbnail_found.connect(lambda _, thumbnail: found.append(thumbnail))
+
+        worker.run()
+
+        self.assertEqual([thumbnail], found)
+
+    def test_shrink(self) -> None:
+        """Report large thumbnails at the size that they are displayed."""
+        image = QtGui.QImage(800, 1600, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("red"))
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+
+        artwork = mock.Mock()
+        artwork.get_identifier.return_value = 1
+        artwork.get_thumbnail_data.return_value = data.data()
+        found: list[bytes] = []
+        worker = threader.ThumbnailWorker(artwork)
+        worker.thumbnail_found.connect(lambda _, thumbnail: found.append(thumbnail))
+
+        worker.run()
+
+        (thumbnail,) = found
+        shrunk = QtGui.QImage.fromData(thumbnail)
+        self.assertEqual(
+            QtCore.QSize(100, threader.MAXIMUM_THUMBNAIL_HEIGHT), shrunk.size()
+        )
+        self.assertLess(len(thumbnail), data.size())
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    """Every test in this module needs Qt to be running."""
+    get_application()